@@ -1,5 +1,6 @@
 import os, subprocess, sys, yaml
 import contextlib
+import threading
 import felupe as fe
 import re
 import msvcrt
@@ -19,16 +20,22 @@ else:
 
 DEFAULT_TEMPLATE = os.path.join(BASE_DIR, "template2.feb")
 
+# sys.stdout/stderr are process-wide; pipeline stages of different jobs must not redirect concurrently
+_REDIRECT_LOCK = threading.RLock()
+
 @contextlib.contextmanager
-def redirect_output_to_file(log_path):
+def redirect_output_to_file(log_path, log_fp=None):
     """
     Redirects Python-level stdout/stderr to a log file.
     Does NOT capture C-level output (like Gmsh), but safe for tqdm.
+    If log_fp (an already open handle) is given, it is used instead of reopening log_path.
     """
-    if log_path:
-        os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+    if log_path or log_fp:
+        if log_fp is None:
+            os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
         
-        with open(log_path, "a", encoding='utf-8') as f:
+        log_cm = contextlib.nullcontext(log_fp) if log_fp else open(log_path, "a", encoding='utf-8')
+        with _REDIRECT_LOCK, log_cm as f:
             old_stdout = sys.stdout
             old_stderr = sys.stderr
             try:
@@ -42,6 +49,33 @@ def redirect_output_to_file(log_path):
         yield sys.stdout
 
 
+@contextlib.contextmanager
+def _kill_on_stop(proc, check_stop_callback, interval=0.2):
+    """
+    Kills proc as soon as check_stop_callback() turns true, even while the caller is
+    blocked reading its stdout (a silent solver), so a stop never needs QThread.terminate.
+    """
+    if check_stop_callback is None:
+        yield
+        return
+    done = threading.Event()
+
+    def watch():
+        while not done.wait(interval):
+            if proc.poll() is not None:
+                return
+            if check_stop_callback():
+                proc.kill()
+                return
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    try:
+        yield
+    finally:
+        done.set()
+
+
 def _get_simulation_total_time(feb_path):
     """ 
     Parses .feb file to calculate Total Simulation Time.
@@ -77,7 +111,7 @@ def _get_simulation_total_time(feb_path):
     except Exception:
         return 1.0
 
-def run_meshing(step_file, config, temp_dir, log_path=None, log_callback=None, check_stop_callback=None):
+def run_meshing(step_file, config, temp_dir, log_path=None, log_callback=None, check_stop_callback=None, log_fp=None):
     base_name = os.path.splitext(os.path.basename(step_file))[0]
     out_vtk = os.path.join(temp_dir, f"{base_name}.vtk")
     
@@ -88,8 +122,9 @@ def run_meshing(step_file, config, temp_dir, log_path=None, log_callback=None, c
     
     # os.makedirs(os.path.dirname(os.path.abspath(GLOBAL_LOG_PATH)), exist_ok=True)
     
-    if log_path:
-        with open(log_path, "a", encoding="utf-8") as f_log:
+    if log_path or log_fp:
+        log_cm = contextlib.nullcontext(log_fp) if log_fp else open(log_path, "a", encoding="utf-8")
+        with log_cm as f_log:
             f_log.write(f"\n--- Meshing Log for {base_name} ---\n")
             f_log.flush()
             
@@ -106,15 +141,19 @@ def run_meshing(step_file, config, temp_dir, log_path=None, log_callback=None, c
                     creationflags=cflags
                 )
 
-                for line in proc.stdout:
-                    if check_stop_callback and check_stop_callback():
-                        proc.kill()
-                        f_log.write("\n!!! Meshing Stopped by User !!!\n")
-                        raise KeyboardInterrupt("SkipJob")
+                with _kill_on_stop(proc, check_stop_callback):
+                    for line in proc.stdout:
+                        if check_stop_callback and check_stop_callback():
+                            break
 
-                    f_log.write(line)
-                    if log_callback:
-                        log_callback(line.strip())
+                        f_log.write(line)
+                        if log_callback:
+                            log_callback(line.strip())
+                if check_stop_callback and check_stop_callback():
+                    proc.kill()
+                    proc.wait()
+                    f_log.write("\n!!! Meshing Stopped by User !!!\n")
+                    return None
                 proc.wait()
                 if proc.returncode != 0:
                     raise subprocess.CalledProcessError(proc.returncode, cmd)
@@ -132,8 +171,8 @@ def run_meshing(step_file, config, temp_dir, log_path=None, log_callback=None, c
     return out_vtk
 
 
-def run_integration(vtk_path, template, out_feb, push_dist_override=None, steps=None, material_name=None, material_config_path=None, log_path=None):
-    with redirect_output_to_file(log_path):
+def run_integration(vtk_path, template, out_feb, push_dist_override=None, steps=None, material_name=None, material_config_path=None, log_path=None, log_fp=None):
+    with redirect_output_to_file(log_path, log_fp):
         print(f"--- Integration Log for {vtk_path} ---")
         
         import meshio
@@ -186,7 +225,7 @@ def run_integration(vtk_path, template, out_feb, push_dist_override=None, steps=
 
     return out_feb 
 
-def run_solver_and_extract(feb_path, result_dir, log_path=None, num_threads=None, febio_exe=None, log_callback=None, progress_callback=None, check_stop_callback=None):
+def run_solver_and_extract(feb_path, result_dir, log_path=None, num_threads=None, febio_exe=None, log_callback=None, progress_callback=None, check_stop_callback=None, log_fp=None):
     base_name = os.path.splitext(os.path.basename(feb_path))[0]
     work_dir = os.path.dirname(feb_path) # Temp directory
     
@@ -244,7 +283,11 @@ def run_solver_and_extract(feb_path, result_dir, log_path=None, num_threads=None
     
     try:
         # Open combined log file
-        f_global = open(log_path, "a", encoding="utf-8") if log_path else open(os.devnull, "w")
+        # Caller-owned handle (log_fp) is written to but never closed here
+        if log_fp:
+            f_global = log_fp
+        else:
+            f_global = open(log_path, "a", encoding="utf-8") if log_path else open(os.devnull, "w")
         
         try:
             f_global.write(f"\n--- Solver Log for {base_name} ---\n")
@@ -280,37 +323,43 @@ def run_solver_and_extract(feb_path, result_dir, log_path=None, num_threads=None
                     )
                     
                     # Read and log output
-                    for line in proc.stdout:
-                        # Check external stop request (GUI)
-                        if check_stop_callback and check_stop_callback():
-                            proc.kill()
-                            f_global.write("!!! Solver Stopped by User !!!\n")
-                            return False
+                    # (a silent solver is killed by _kill_on_stop, which ends this loop)
+                    with _kill_on_stop(proc, check_stop_callback):
+                        for line in proc.stdout:
+                            # Check external stop request (GUI)
+                            if check_stop_callback and check_stop_callback():
+                                break
+
+                            f_global.write(line) # Unified log
+                            if log_callback:
+                                log_callback(line.strip())
+
+                            # Update Progress
+                            if "time" in line:
+                                match = re.search(r"time\s*=\s*([\d\.eE\+\-]+)", line, re.IGNORECASE)
+                                if match:
+                                    try:
+                                        current_time = float(match.group(1))
+                                        if progress_callback:
+                                            percent = int((current_time / total_time) * 100) if total_time > 0 else 0
+                                            progress_callback(min(percent, 99))
+                                        elif solver_bar:
+                                            solver_bar.n = current_time
+                                            solver_bar.refresh()
+                                        last_refresh_time = time.time()
+                                    except ValueError:
+                                        pass
+                        
+                            if solver_bar and time.time() - last_refresh_time > 2.0:
+                                solver_bar.refresh()
+                                last_refresh_time = time.time()
 
-                        f_global.write(line) # Unified log
-                        if log_callback:
-                            log_callback(line.strip())
+                    if check_stop_callback and check_stop_callback():
+                        proc.kill()
+                        proc.wait()
+                        f_global.write("!!! Solver Stopped by User !!!\n")
+                        return None
 
-                        # Update Progress
-                        if "time" in line:
-                            match = re.search(r"time\s*=\s*([\d\.eE\+\-]+)", line, re.IGNORECASE)
-                            if match:
-                                try:
-                                    current_time = float(match.group(1))
-                                    if progress_callback:
-                                        percent = int((current_time / total_time) * 100) if total_time > 0 else 0
-                                        progress_callback(min(percent, 99))
-                                    elif solver_bar:
-                                        solver_bar.n = current_time
-                                        solver_bar.refresh()
-                                    last_refresh_time = time.time()
-                                except ValueError:
-                                    pass
-                        
-                        if solver_bar and time.time() - last_refresh_time > 2.0:
-                            solver_bar.refresh()
-                            last_refresh_time = time.time()
-                    
                     proc.wait()
                     last_error_code = proc.returncode
                     f_global.write(f"DEBUG: Solver Finished with Return Code = {last_error_code}\n")
@@ -337,7 +386,7 @@ def run_solver_and_extract(feb_path, result_dir, log_path=None, num_threads=None
                 return False
 
         finally:
-             if f_global: f_global.close()
+             if f_global and f_global is not log_fp: f_global.close()
             
     except Exception as e:
         if proc and proc.poll() is None:
@@ -346,21 +395,17 @@ def run_solver_and_extract(feb_path, result_dir, log_path=None, num_threads=None
         
         # Log error to global log if possible
         try:
-             with open(log_path, "a", encoding="utf-8") as f_err:
-                f_err.write(f"!!! Solver Exception: {str(e)} !!!\n")
+            if log_fp:
+                log_fp.write(f"!!! Solver Exception: {str(e)} !!!\n")
+            else:
+                with open(log_path, "a", encoding="utf-8") as f_err:
+                    f_err.write(f"!!! Solver Exception: {str(e)} !!!\n")
         except:
             pass
 
-        if isinstance(e, KeyboardInterrupt) and str(e) == "SkipJob":
-            return False
-        
         if not progress_callback: # CLI
              print(f"Solver error: {e}")
         
-        # Re-raise if it's not a handled skip
-        if isinstance(e, KeyboardInterrupt) and str(e) != "SkipJob":
-            raise e
-        
         # For GUI worker to catch
         raise e
     finally:
@@ -377,7 +422,7 @@ def run_solver_and_extract(feb_path, result_dir, log_path=None, num_threads=None
     # In unified mode, we don't parse a separate log file for "Normal Termination".
     # We rely on proc.returncode == 0 checked above.
     
-    with redirect_output_to_file(log_path):
+    with redirect_output_to_file(log_path, log_fp):
         # src_dir is now the same as work_dir (temp)
         # Helper for file rotation/movement with retries
         def safe_move(src, dst):
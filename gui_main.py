@@ -142,11 +142,11 @@ def main():
     splash_pix = QPixmap(splash_width, splash_height)
     splash_pix.fill(QColor("#202020")) # Dark Gray Background
     
-    # Load Logo
-    logo = QPixmap(logo_path)
+    # Load Logo (decoded straight to its splash size)
+    from src.gui.utils import load_scaled_pixmap
+    target_width = 500
+    logo = load_scaled_pixmap(logo_path, target_width)
     if not logo.isNull():
-        target_width = 500
-        logo = logo.scaledToWidth(target_width, Qt.SmoothTransformation)
         painter = QPainter(splash_pix)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         x = (splash_width - logo.width()) // 2
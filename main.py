@@ -1,4 +1,4 @@
-import os, glob, sys, argparse
+import os, sys, argparse
 import yaml
 import time
 from tqdm import tqdm
@@ -40,7 +40,12 @@ def main():
         generate_adaptive_mesh(args.internal_config, args.internal_stp, args.internal_out)
         return
 
-    steps = glob.glob(os.path.join(INPUT_DIR, "*.stp")) + glob.glob(os.path.join(INPUT_DIR, "*.step"))
+    # One pass over input/ (same extension rule as the GUI's file watcher)
+    try:
+        with os.scandir(INPUT_DIR) as it:
+            steps = [e.path for e in it if e.name.lower().endswith(('.stp', '.step')) and e.is_file()]
+    except OSError:  # no input/ folder: nothing to run
+        steps = []
     
     # Show Logo using 'art' library
     try:
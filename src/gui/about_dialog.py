@@ -3,6 +3,7 @@ from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt
 import os
 import src.version as v
+from src.gui.utils import load_scaled_pixmap
 
 # ==========================================
 #  EDIT ABOUT TEXT HERE
@@ -54,8 +55,6 @@ class AboutDialog(QDialog):
         logo_path = os.path.join(root_dir, "doc", "VEXIS-CAE-LOGO-LARGE.png")
         
         if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            
             # High-DPI support:
             # Calculate target physical pixels based on logical width and device pixel ratio
             screen = self.screen()
@@ -65,7 +64,7 @@ class AboutDialog(QDialog):
             logical_width = 450
             target_px = int(logical_width * dpr)
             
-            scaled = pixmap.scaledToWidth(target_px, Qt.SmoothTransformation)
+            scaled = QPixmap(load_scaled_pixmap(logo_path, target_px))  # copy: the cached one stays at dpr 1
             scaled.setDevicePixelRatio(dpr)
             
             logo_label.setPixmap(scaled)
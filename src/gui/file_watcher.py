@@ -1,9 +1,41 @@
 import os
-import glob
-from PySide6.QtCore import QObject, Signal, QFileSystemWatcher
+import sys
+from PySide6.QtCore import QObject, Signal, Slot, QFileSystemWatcher, QTimer
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
+DEFAULT_POLL_INTERVAL = 30  # seconds, used only on network filesystems
+
+# Filesystems whose change notifications are unreliable (Linux /proc/mounts fstype)
+_NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smbfs", "smb3", "sshfs", "fuse.sshfs", "afs", "9p"}
+
+
+def _is_network_path(path):
+    """True if path lives on a network share, where OS change notifications cannot be trusted."""
+    path = os.path.abspath(path)
+    try:
+        if os.name == 'nt':
+            if path.startswith("\\\\"):  # UNC path
+                return True
+            import ctypes
+            drive = os.path.splitdrive(path)[0] + "\\"
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == 4  # DRIVE_REMOTE
+        if sys.platform.startswith("linux"):
+            best_mount, best_type = "", ""
+            with open("/proc/mounts", "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) < 3:
+                        continue
+                    mount = parts[1].replace("\\040", " ")
+                    if (path == mount or path.startswith(mount.rstrip("/") + "/")) and len(mount) > len(best_mount):
+                        best_mount, best_type = mount, parts[2]
+            return best_type in _NETWORK_FS_TYPES
+    except Exception:
+        pass
+    return False
+
 class _StepFileHandler(FileSystemEventHandler):
     def __init__(self, callback_added, callback_removed):
         self.callback_added = callback_added
@@ -25,15 +57,34 @@ class _StepFileHandler(FileSystemEventHandler):
             self.callback_added(event.dest_path)
 
 class InputFolderWatcher(QObject):
-    file_added = Signal(str)
-    file_removed = Signal(str)
+    """
+    Watches input/ for STEP files. Raw watchdog events are collected on the GUI thread and
+    reported as one files_changed(added, removed) per burst, DEBOUNCE_MS after the last event.
+    """
+    DEBOUNCE_MS = 100
 
-    def __init__(self, input_dir):
+    files_changed = Signal(list, list)  # added paths, removed paths
+    _raw_event = Signal(str, bool)      # path, added (observer thread -> GUI thread)
+
+    def __init__(self, input_dir, poll_interval=DEFAULT_POLL_INTERVAL):
         super().__init__()
         self.input_dir = os.path.abspath(input_dir)
-        self.observer = Observer()
+        self.poll_interval = poll_interval
+        # Native notifications (inotify/FSEvents/ReadDirectoryChangesW) cost nothing while idle;
+        # polling is only needed on network shares, where those events are not delivered
+        if _is_network_path(self.input_dir):
+            self.observer = PollingObserver(timeout=self.poll_interval)
+        else:
+            self.observer = Observer()
         self.handler = _StepFileHandler(self._on_added, self._on_removed)
 
+        self._pending = {}  # path -> True (added) / False (removed); last event wins
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._emit_pending)
+        self._raw_event.connect(self._queue_event)
+
     def start(self):
         if not os.path.exists(self.input_dir):
             os.makedirs(self.input_dir)
@@ -45,12 +96,31 @@ class InputFolderWatcher(QObject):
         self.observer.join()
 
     def get_existing_files(self):
-        files = glob.glob(os.path.join(self.input_dir, "*.stp")) + \
-                glob.glob(os.path.join(self.input_dir, "*.step"))
+        # One directory pass, same extension rule as the event handler
+        try:
+            with os.scandir(self.input_dir) as it:
+                files = [entry.path for entry in it
+                         if entry.name.lower().endswith(('.stp', '.step')) and entry.is_file()]
+        except OSError:
+            return []
         return [os.path.abspath(f) for f in files]
 
     def _on_added(self, path):
-        self.file_added.emit(os.path.abspath(path))
+        self._raw_event.emit(os.path.abspath(path), True)
 
     def _on_removed(self, path):
-        self.file_removed.emit(os.path.abspath(path))
+        self._raw_event.emit(os.path.abspath(path), False)
+
+    @Slot(str, bool)
+    def _queue_event(self, path, added):
+        self._pending.pop(path, None)  # keep event order for paths seen more than once
+        self._pending[path] = added
+        self._debounce_timer.start()  # restarts while the burst continues
+
+    @Slot()
+    def _emit_pending(self):
+        pending, self._pending = self._pending, {}
+        added = [path for path, is_added in pending.items() if is_added]
+        removed = [path for path, is_added in pending.items() if not is_added]
+        if added or removed:
+            self.files_changed.emit(added, removed)
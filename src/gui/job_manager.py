@@ -1,177 +1,277 @@
 import os
-import glob
-import re
-import uuid
+import queue
+import threading
 import time
+import uuid
 import yaml
-from PySide6.QtCore import QObject, QThread, Signal, Slot
-from src.gui.models.job_item import JobItem, JobStatus
+from collections import OrderedDict, deque
+from PySide6.QtCore import QObject, QThread, Qt, Signal, Slot
+from src.gui.models.job_item import JobItem, JobStatus, natural_sort_key
 import analysis_helpers as helpers
 
-class AnalysisWorker(QThread):
-    progress_updated = Signal(str, int, str) # job_id, progress, status_text
-    log_updated = Signal(str, str)           # job_id, log_line
-    finished = Signal(str, bool, str)             # job_id, success, error_message
 
-    def __init__(self, job: JobItem, config_path: str, temp_dir: str, result_dir: str):
+def _load_analysis_config(config_path):
+    """Read the 'analysis' section of config.yaml into stage worker parameters (once per batch)."""
+    params = {
+        "push_dist": None,  # Noneで「上書きしない」を表現
+        "sim_steps": None,
+        "febio_path": None,
+        "template_name": "template2.feb",
+        "material_name": None,
+        "num_threads": None,
+    }
+    if os.path.exists(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            conf = yaml.safe_load(f).get("analysis", {})
+            # total_stroke優先、push_dist互換 (main.pyと同様)
+            if "total_stroke" in conf:
+                params["push_dist"] = -1.0 * abs(float(conf["total_stroke"]))
+            elif "push_dist" in conf:
+                params["push_dist"] = float(conf["push_dist"])
+            params["sim_steps"] = conf.get("time_steps")
+            params["febio_path"] = conf.get("febio_path")
+            params["template_name"] = conf.get("template_feb", params["template_name"])
+            params["material_name"] = conf.get("material_name")
+            params["num_threads"] = conf.get("num_threads")
+
+    # Resolve template path relative to the vexis root (config.yaml lives in <root>/config)
+    base_dir = os.path.dirname(os.path.dirname(config_path))
+    template_path = os.path.join(base_dir, params["template_name"])
+    if not os.path.exists(template_path):
+        # Fallback to internal default if not found
+        template_path = helpers.DEFAULT_TEMPLATE
+    params["template_path"] = template_path
+    # material.yamlのパスを解決
+    params["material_config_path"] = os.path.join(os.path.dirname(config_path), "material.yaml")
+    return params
+
+
+class StageWorker(QThread):
+    """
+    Runs one pipeline stage (meshing, FEBio model preparation or solving) for every job
+    submitted to it during a batch; the thread exits when it receives the None sentinel.
+
+    Subclasses implement _run_stage() and return the produced file path, or None when
+    the stage was stopped/skipped or failed (with self.error_message set).
+    """
+    stage = None
+    log_mode = "a"  # MeshWorker starts a fresh log with "w"
+    LOG_BUFFER_SIZE = 65536
+    LOG_FLUSH_INTERVAL = 0.05  # seconds; log lines are sent to the GUI in chunks at most this often
+
+    progress_updated = Signal(str, int, str)  # job_id, progress, status_text
+    log_chunk = Signal(str, list)             # job_id, [log_line, ...]
+    stage_finished = Signal(str, str, str)    # job_id, produced_path ("" if none), error_message
+
+    def __init__(self, config_path: str, analysis_conf: dict, temp_dir: str, result_dir: str):
         super().__init__()
-        self.job = job
+        self.job = None
         self.config_path = config_path
+        self.conf = analysis_conf  # _load_analysis_config() result, resolved once per batch
         self.temp_dir = temp_dir
         self.result_dir = result_dir
-        self._is_running = True
+        self.log_path = None
+        self._log_fp = None  # one buffered handle per stage, shared with the helpers
+        self._log_buffer = []  # lines not yet sent to the GUI
+        self._log_lock = threading.Lock()  # the helpers' stop watcher thread also flushes (see _check_stop)
+        self._last_log_flush = 0.0
+        self.error_message = ""
+        self._stop_event = threading.Event()  # polled by the helpers via _check_stop
+        self._stopped = False  # _stopped/_skipped tell the two stop reasons apart
+        self._skipped = False
+        self._inbox = queue.Queue()
+
+    def submit(self, job: JobItem):
+        """Queue a job for this worker (GUI thread). Per-job state is reset here, before the
+        worker picks the job up, so a stop()/skip() issued right after submit is not lost."""
+        self.job = job
+        self.log_path = os.path.join(self.temp_dir, f"{job.name}.log")
+        self.error_message = ""
+        self._stop_event.clear()
         self._stopped = False
         self._skipped = False
+        self._inbox.put(job)
+
+    def shutdown(self):
+        """Let the thread exit once its current job (if any) is done."""
+        self._inbox.put(None)
 
     def run(self):
-        job_id = self.job.id
-        base_name = self.job.name
-        
-        def log_cb(line):
-            self.log_updated.emit(job_id, line)
-            
-        def prog_cb(percent):
-            # Scale solver percentage (20-99%)
-            val = 20 + int(percent * 0.79)
-            self.progress_updated.emit(job_id, val, f"Solving ({percent}%)")
+        while True:
+            job = self._inbox.get()
+            if job is None:
+                break
+            self._run_job(job)
 
+    def _run_job(self, job):
+        job_id = job.id
         try:
-            # --- Load Config ---
-            push_dist, sim_steps = None, None  # Noneで「上書きしない」を表現
-            febio_path = None
-            template_name = "template2.feb"
-            material_name = None
-            num_threads = None
-            
-            if os.path.exists(self.config_path):
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    conf = yaml.safe_load(f).get("analysis", {})
-                    # total_stroke優先、push_dist互換 (main.pyと同様)
-                    if "total_stroke" in conf:
-                        push_dist = -1.0 * abs(float(conf["total_stroke"]))
-                    elif "push_dist" in conf:
-                        push_dist = float(conf["push_dist"])
-                    sim_steps = conf.get("time_steps")
-                    febio_path = conf.get("febio_path")
-                    template_name = conf.get("template_feb", template_name)
-                    material_name = conf.get("material_name")
-                    num_threads = conf.get("num_threads")
-
-            # Resolve template path (relative to config dir usually, but here relative to root/base)
-            # Assuming template is in the app root or specified path
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(self.config_path))) # vexis root
-            template_path = os.path.join(base_dir, template_name)
-            if not os.path.exists(template_path):
-                # Fallback to internal default if not found
-                template_path = helpers.DEFAULT_TEMPLATE
-
-            # --- Initialize Log ---
-            log_path = os.path.join(self.temp_dir, f"{base_name}.log")
-            # Clear previous log
-            with open(log_path, "w", encoding="utf-8") as f: 
-                f.write(f"=== Analysis Log for {base_name} ===\n")
-
-            # Callback to check if stopped/skipped from GUI thread
-            def check_stop():
-                return not self._is_running
-
-            # --- 1. Meshing ---
-            self.progress_updated.emit(job_id, 1, "Meshing...")
-            try:
-                vtk_path = helpers.run_meshing(self.job.step_path, self.config_path, self.temp_dir, 
-                                             log_path=log_path, log_callback=log_cb, 
-                                             check_stop_callback=check_stop)
-            except KeyboardInterrupt:
-                if self._skipped:
-                    self.finished.emit(job_id, False, "Skipped by user")
-                    return
-                if self._stopped:
-                    self.finished.emit(job_id, False, "Stopped by user")
-                    return
-                # If unknown interrupt, re-raise
-                raise
-            
-            self.job.vtk_path = vtk_path
-            self.progress_updated.emit(job_id, 5, "Mesh Complete")
-            
-            if not self._is_running: 
-                if self._skipped: self.finished.emit(job_id, False, "Skipped by user")
-                else: self.finished.emit(job_id, False, "Stopped by user")
-                return
+            self._log_fp = open(self.log_path, self.log_mode, buffering=self.LOG_BUFFER_SIZE, encoding="utf-8")
+            produced = self._run_stage()
+        except Exception as e:
+            msg = f"Worker Error: {str(e)}"
+            self._log_buffer.append(msg)
+            self._flush_log()
+            self.progress_updated.emit(job_id, 100, "Failed")
+            self.stage_finished.emit(job_id, "", str(e))
+            return
+        finally:
+            if self._log_fp:
+                self._log_fp.close()
+                self._log_fp = None
 
-            # --- 2. Integration ---
-            self.progress_updated.emit(job_id, 10, "Preparing FEBio model...")
-            out_feb = os.path.join(self.temp_dir, f"{base_name}.feb")
-            # material.yamlのパスを解決
-            material_config_path = os.path.join(os.path.dirname(self.config_path), "material.yaml")
-            helpers.run_integration(
-                vtk_path, template_path, out_feb,
-                push_dist, sim_steps,
-                material_name, material_config_path,
-                log_path=log_path
-            )
-            self.job.feb_path = out_feb
-            self.progress_updated.emit(job_id, 15, "Prep Complete")
-            
-            if not self._is_running: 
-                if self._skipped: self.finished.emit(job_id, False, "Skipped by user")
-                else: self.finished.emit(job_id, False, "Stopped by user")
-                return
+        self._flush_log()
+        if self._stop_event.is_set():
+            reason = "Skipped by user" if self._skipped else "Stopped by user"
+            self.stage_finished.emit(job_id, "", reason)
+        else:
+            self.stage_finished.emit(job_id, produced or "", self.error_message)
 
-            # --- 3. Solver ---
-            self.progress_updated.emit(job_id, 20, "Solving (0%)")
-            
-            success = helpers.run_solver_and_extract(
-                out_feb, self.result_dir, 
-                log_path=log_path,
-                num_threads=num_threads,
-                febio_exe=febio_path,
-                log_callback=log_cb, 
-                progress_callback=prog_cb,
-                check_stop_callback=check_stop
-            )
-            
-            # If manually stopped or skipped (via check_stop_callback in solver loop)
-            if self._stopped:
-                self.progress_updated.emit(job_id, 100, "Stopped")
-                self.finished.emit(job_id, False, "Stopped by user")
-                return
-            if self._skipped:
-                self.progress_updated.emit(job_id, 100, "Skipped")
-                self.finished.emit(job_id, False, "Skipped by user")
-                return
+    def _check_stop(self):
+        # Callback to check if stopped/skipped from GUI thread. The helpers' stop watcher also
+        # polls this while the tool is silent, so lines held back by _log_cb are sent from here
+        if self._log_buffer and time.monotonic() - self._last_log_flush >= self.LOG_FLUSH_INTERVAL:
+            self._flush_log()
+        return self._stop_event.is_set()
 
-            if success:
-                self.progress_updated.emit(job_id, 100, "Completed")
-                self.finished.emit(job_id, True, "")
-            else:
-                self.progress_updated.emit(job_id, 100, "Error")
-                self.finished.emit(job_id, False, "Solver failed (check log)")
+    def _log_cb(self, line):
+        with self._log_lock:
+            self._log_buffer.append(line)
+        if time.monotonic() - self._last_log_flush >= self.LOG_FLUSH_INTERVAL:
+            self._flush_log()
 
-        except Exception as e:
-            msg = f"Worker Error: {str(e)}"
-            self.log_updated.emit(job_id, msg)
-            self.progress_updated.emit(job_id, 100, "Failed")
-            self.finished.emit(job_id, False, str(e))
+    def _flush_log(self):
+        with self._log_lock:
+            if self._log_buffer:
+                lines, self._log_buffer = self._log_buffer, []
+                self.log_chunk.emit(self.job.id, lines)
+            self._last_log_flush = time.monotonic()
 
     def stop(self):
-        self._is_running = False
         self._stopped = True
-        # finished signal will be emitted in run()
+        self._stop_event.set()
+        # stage_finished signal will be emitted in _run_job()
 
     def skip(self):
-        self._is_running = False
         self._skipped = True
-        # Emit skipped status update immediately for UI feedback, but do NOT emit finished yet
-        self.log_updated.emit(self.job.id, ">>> Skipped by user")
+        self._stop_event.set()
+        # Emit skipped status update immediately for UI feedback, but do NOT emit stage_finished yet
+        self.log_chunk.emit(self.job.id, [">>> Skipped by user"])
         self.progress_updated.emit(self.job.id, 100, "Skipping...")
 
+
+class MeshWorker(StageWorker):
+    stage = "mesh"
+    log_mode = "w"  # Clear previous log
+
+    def _run_stage(self):
+        job_id = self.job.id
+
+        # --- Initialize Log ---
+        self._log_fp.write(f"=== Analysis Log for {self.job.name} ===\n")
+
+        self.progress_updated.emit(job_id, 1, "Meshing...")
+        vtk_path = helpers.run_meshing(self.job.step_path, self.config_path, self.temp_dir,
+                                       log_path=self.log_path, log_callback=self._log_cb,
+                                       check_stop_callback=self._check_stop,
+                                       log_fp=self._log_fp)
+        if vtk_path is None:  # stopped/skipped
+            return None
+
+        self.job.vtk_path = vtk_path
+        self.progress_updated.emit(job_id, 5, "Mesh Complete")
+        return vtk_path
+
+
+class IntegrateWorker(StageWorker):
+    stage = "integrate"
+
+    def _run_stage(self):
+        job_id = self.job.id
+        conf = self.conf
+
+        self.progress_updated.emit(job_id, 10, "Preparing FEBio model...")
+        out_feb = os.path.join(self.temp_dir, f"{self.job.name}.feb")
+        helpers.run_integration(
+            self.job.vtk_path, conf["template_path"], out_feb,
+            conf["push_dist"], conf["sim_steps"],
+            conf["material_name"], conf["material_config_path"],
+            log_path=self.log_path, log_fp=self._log_fp
+        )
+        self.job.feb_path = out_feb
+        self.progress_updated.emit(job_id, 15, "Prep Complete")
+        return out_feb
+
+
+class SolveWorker(StageWorker):
+    stage = "solve"
+
+    def _run_stage(self):
+        job_id = self.job.id
+        conf = self.conf
+
+        def prog_cb(percent):
+            # Scale solver percentage (20-99%)
+            val = 20 + int(percent * 0.79)
+            text = f"Solving ({percent}%)"
+            # FEBio often repeats the same percent; only forward actual changes to the GUI thread
+            if val == self._last_prog_val and text == self._last_prog_text:
+                return
+            self._last_prog_val = val
+            self._last_prog_text = text
+            self.progress_updated.emit(job_id, val, text)
+
+        self._last_prog_val = 20
+        self._last_prog_text = "Solving (0%)"
+        self.progress_updated.emit(job_id, 20, "Solving (0%)")
+        success = helpers.run_solver_and_extract(
+            self.job.feb_path, self.result_dir,
+            log_path=self.log_path,
+            num_threads=conf["num_threads"],
+            febio_exe=conf["febio_path"],
+            log_callback=self._log_cb,
+            progress_callback=prog_cb,
+            check_stop_callback=self._check_stop,
+            log_fp=self._log_fp
+        )
+
+        # If manually stopped or skipped (via check_stop_callback in solver loop)
+        if self._stopped:
+            self.progress_updated.emit(job_id, 100, "Stopped")
+            return None
+        if self._skipped:
+            self.progress_updated.emit(job_id, 100, "Skipped")
+            return None
+
+        if success:
+            self.progress_updated.emit(job_id, 100, "Completed")
+            return self.result_dir
+        self.progress_updated.emit(job_id, 100, "Error")
+        self.error_message = "Solver failed (check log)"
+        return None
+
+
 class JobManager(QObject):
-    job_added = Signal(JobItem)
-    job_removed = Signal(str)
-    status_changed = Signal(str, JobStatus)
+    """
+    Owns the job list and runs batches as a three-stage pipeline:
+    mesh -> integrate (FEBio model prep) -> solve.
+
+    While job N is being solved, the next jobs are meshed and prepared so the
+    solver never waits on meshing. FEBio is already multi-threaded, so only
+    one solver runs at a time; meshing runs up to MAX_MESH_WORKERS jobs ahead.
+    """
+    MAX_MESH_WORKERS = 2
+    PIPELINE_DEPTH = 2  # max jobs meshed/prepared ahead of the solver
+    STAGE_WORKERS = {"mesh": (MeshWorker, MAX_MESH_WORKERS),
+                     "integrate": (IntegrateWorker, 1),
+                     "solve": (SolveWorker, 1)}
+
+    jobs_added = Signal(list)                # list[JobItem], emitted once per add_jobs_from_paths
+    jobs_removed = Signal(list)              # list[str] job ids, emitted once per remove_jobs_by_paths
+    status_changed = Signal(str, object)     # job_id, JobStatus
     progress_changed = Signal(str, int, str) # job_id, progress, status_text
-    log_added = Signal(str, str)             # job_id, log_line
+    log_chunk = Signal(str, list)            # job_id, [log_line, ...]
+    batch_finished = Signal()                # last job of a batch left the pipeline (done or stopped)
 
     def __init__(self, input_dir, temp_dir, result_dir, config_path):
         super().__init__()
@@ -179,9 +279,22 @@ class JobManager(QObject):
         self.temp_dir = temp_dir
         self.result_dir = result_dir
         self.config_path = config_path
+        # Result graph path = prefix + job name + suffix (avoids os.path.join per added file)
+        self._result_prefix = os.path.join(result_dir, "")
+        self._result_png_suffix = "_graph.png"
         self.jobs = {} 
-        self.worker = None
+        self._path_index = {}  # canonical step path -> job_id
+        self._integrate_queue = deque()  # meshed jobs waiting for FEBio model prep
+        self._solve_queue = deque()      # prepared jobs waiting for the solver
+        self._workers = {"mesh": [], "integrate": [], "solve": []}  # stage -> this batch's worker threads
+        self._busy = {}  # worker -> job it is processing (insertion order = dispatch order)
+        self._threads = set()  # keeps QThread objects alive until they have actually exited
         self._batch_running = False
+        self._stopping = False  # stop requested; batch_finished waits for the busy workers
+        self._batch_conf = None  # analysis settings read at start_batch
+        self._ordered_jobs = None  # tuple of jobs in natural order; None after add/remove
+        self._pending_ids = OrderedDict()  # job_id -> job, PENDING jobs of the batch in natural order
+        self._pending_dirty = False  # jobs were added mid-batch; rebuild _pending_ids before dispatch
 
     def get_invalid_jobs(self):
         """非ASCII文字を含むジョブのリストを返す"""
@@ -189,23 +302,31 @@ class JobManager(QObject):
         for job in self.jobs.values():
             if job.status == JobStatus.PENDING:
                 # ファイル名 (job.name) と パス (job.step_path) 両方をチェック
-                try:
-                    job.name.encode('ascii')
-                    job.step_path.encode('ascii')
-                except UnicodeEncodeError:
+                if not (job.name.isascii() and job.step_path.isascii()):
                     invalid_jobs.append(job)
         return invalid_jobs
 
-    def add_job_from_path(self, step_path):
+    @staticmethod
+    def _canonical_key(path):
+        """Key used for duplicate detection (resolves symlinks and case on Windows)."""
+        return os.path.normcase(os.path.realpath(path))
+
+    def add_jobs_from_paths(self, step_paths):
+        """Register many files at once and notify listeners with a single jobs_added signal."""
+        jobs = [job for job in map(self._create_job, step_paths) if job is not None]
+        if jobs:
+            self.jobs_added.emit(jobs)
 
+    def _create_job(self, step_path):
+        """Create and register a JobItem, or return None if the file is already listed."""
         path = os.path.abspath(step_path)
-        for j in self.jobs.values():
-            if os.path.abspath(j.step_path) == path:
-                return
+        key = self._canonical_key(path)
+        if key in self._path_index:
+            return None
                 
         name = os.path.splitext(os.path.basename(path))[0]
         job_id = str(uuid.uuid4())[:8]
-        job = JobItem(id=job_id, name=name, step_path=path)
+        job = JobItem(id=job_id, name=name, step_path=path, canonical_path=key)
         
         # Check if results already exist
         if self._has_existing_results(name):
@@ -213,59 +334,86 @@ class JobManager(QObject):
             job.status_text = "Results Available"
         
         self.jobs[job_id] = job
-        self.job_added.emit(job)
+        self._path_index[key] = job_id
+        self._ordered_jobs = None
+        if self._batch_running and job.status == JobStatus.PENDING:
+            self._pending_dirty = True
+        return job
 
     def _has_existing_results(self, job_name):
         """Check if result files exist for this job."""
-        graph_path = os.path.join(self.result_dir, f"{job_name}_graph.png")
-        return os.path.exists(graph_path)
+        try:
+            os.stat(self._result_prefix + job_name + self._result_png_suffix)
+            return True
+        except OSError:
+            return False
     
     def cleanup_job_files(self, job_name):
         """Remove temp and result files for a job before re-analysis."""
-        import shutil
-        
-        # Clean temp files: job_name.vtk, job_name.*.vtk, job_name.feb, job_name.log, etc.
+        # Clean temp files: job_name.vtk, job_name.*.vtk, job_name.feb, job_name.log, job_name_*.vtk, job_name_*.msh
+        temp_exact = {f"{job_name}.vtk", f"{job_name}.feb", f"{job_name}.log"}
         temp_patterns = [
-            os.path.join(self.temp_dir, f"{job_name}.vtk"),
-            os.path.join(self.temp_dir, f"{job_name}.*.vtk"),
-            os.path.join(self.temp_dir, f"{job_name}.feb"),
-            os.path.join(self.temp_dir, f"{job_name}.log"),
-            os.path.join(self.temp_dir, f"{job_name}_*.vtk"),
-            os.path.join(self.temp_dir, f"{job_name}_*.msh"),
+            (f"{job_name}.", ".vtk"),
+            (f"{job_name}_", ".vtk"),
+            (f"{job_name}_", ".msh"),
         ]
-        
-        for pattern in temp_patterns:
-            for f in glob.glob(pattern):
-                try:
-                    os.remove(f)
-                except Exception:
-                    pass
-        
-        # Clean result files
+        self._remove_matching_files(self.temp_dir, temp_exact, temp_patterns)
+
+        # Clean result files: job_name_*.txt, job_name_*.csv, job_name_*.png
         result_patterns = [
-            os.path.join(self.result_dir, f"{job_name}_*.txt"),
-            os.path.join(self.result_dir, f"{job_name}_*.csv"),
-            os.path.join(self.result_dir, f"{job_name}_*.png"),
+            (f"{job_name}_", ".txt"),
+            (f"{job_name}_", ".csv"),
+            (f"{job_name}_", ".png"),
         ]
-        
-        for pattern in result_patterns:
-            for f in glob.glob(pattern):
+        self._remove_matching_files(self.result_dir, set(), result_patterns)
+
+    @staticmethod
+    def _remove_matching_files(directory, exact_names, patterns):
+        """Delete files whose name is in exact_names or matches a (prefix, suffix) pattern (single scandir pass)."""
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            name = entry.name
+            matched = name in exact_names or any(
+                len(name) >= len(prefix) + len(suffix) and name.startswith(prefix) and name.endswith(suffix)
+                for prefix, suffix in patterns
+            )
+            if matched and entry.is_file():
                 try:
-                    os.remove(f)
+                    os.remove(entry.path)
                 except Exception:
                     pass
 
 
-    def remove_job_by_path(self, step_path):
-        target_id = None
+    def remove_jobs_by_paths(self, step_paths):
+        """Unregister many files at once and notify listeners with a single jobs_removed signal."""
+        job_ids = [job_id for job_id in map(self._drop_job, step_paths) if job_id]
+        if job_ids:
+            self.jobs_removed.emit(job_ids)
+
+    def _drop_job(self, step_path):
+        """Unregister the job of a file; returns its id, or None if the file was not listed."""
         path = os.path.abspath(step_path)
-        for j_id, j in self.jobs.items():
-            if os.path.abspath(j.step_path) == path:
-                target_id = j_id
-                break
+        target_id = self._path_index.get(self._canonical_key(path))
+        if target_id is None:
+            # A removed symlink no longer resolves to its target; match the raw path instead
+            for j_id, j in self.jobs.items():
+                if j.step_path == path:
+                    target_id = j_id
+                    break
         if target_id:
-            del self.jobs[target_id]
-            self.job_removed.emit(target_id)
+            job = self.jobs.pop(target_id)
+            self._path_index.pop(job.canonical_path, None)
+            self._pending_ids.pop(target_id, None)
+            # A job waiting between stages must not be handed to the next worker
+            for waiting in (self._integrate_queue, self._solve_queue):
+                if job in waiting:
+                    waiting.remove(job)
+            self._ordered_jobs = None
+        return target_id
 
     def start_batch(self):
         # Reset COMPLETED jobs to PENDING and clean up their files
@@ -277,68 +425,131 @@ class JobManager(QObject):
                 job.status_text = "Pending"
                 self.status_changed.emit(job.id, JobStatus.PENDING)
 
+        self._batch_conf = _load_analysis_config(self.config_path)
+        self._stopping = False
+        self._rebuild_pending()
         self._batch_running = True
-        self.start_next_job()
+        self._advance_pipeline()
+
+    def running_workers(self):
+        """All stage workers whose thread is still alive."""
+        return [w for w in self._threads if w.isRunning()]
+
+    def _in_flight(self):
+        return len(self._busy) + len(self._integrate_queue) + len(self._solve_queue)
+
+    def _busy_in(self, stage):
+        return [w for w in self._busy if w.stage == stage]
+
+    def _sorted_jobs(self):
+        """All jobs in natural order, re-sorted only after the job set changed."""
+        if self._ordered_jobs is None:
+            self._ordered_jobs = tuple(sorted(self.jobs.values(), key=natural_sort_key))
+        return self._ordered_jobs
+
+    def _rebuild_pending(self):
+        # Dispatch takes PENDING jobs from the front, in natural order
+        self._pending_ids = OrderedDict(
+            (job.id, job) for job in self._sorted_jobs() if job.status == JobStatus.PENDING)
+        self._pending_dirty = False
 
-    def start_next_job(self):
+    def _next_pending_job(self):
+        if self._pending_dirty:
+            self._rebuild_pending()
+        return next(iter(self._pending_ids.values()), None)
+
+    def _idle_worker(self, stage):
+        """An idle worker of this batch for the stage, starting a new thread while under the limit."""
+        workers = self._workers[stage]
+        for worker in workers:
+            if worker not in self._busy:
+                return worker
+        worker_cls, limit = self.STAGE_WORKERS[stage]
+        if len(workers) >= limit:
+            return None
+        worker = worker_cls(self.config_path, self._batch_conf, self.temp_dir, self.result_dir)
+        worker.progress_updated.connect(self._on_worker_progress)
+        worker.log_chunk.connect(self._on_worker_log_chunk, Qt.QueuedConnection)
+        worker.stage_finished.connect(self._on_stage_finished)
+        # QThread.finished fires once run() has really returned; only then drop our reference
+        worker.finished.connect(self._on_thread_exited)
+        workers.append(worker)
+        self._threads.add(worker)
+        worker.start()
+        return worker
+
+    def _start_stage(self, stage, job):
+        worker = self._idle_worker(stage)
+        self._busy[worker] = job
+        worker.submit(job)
+
+    def _release_workers(self):
+        """Send the exit sentinel to this batch's workers; busy ones finish their job first."""
+        for workers in self._workers.values():
+            for worker in workers:
+                worker.shutdown()
+            workers.clear()
+
+    def _advance_pipeline(self):
+        """Start every stage worker that has both an idle slot and queued input."""
         if not self._batch_running:
             return
-            
-        if self.worker and self.worker.isRunning():
-            return
-        
-        # Natural sort key function (same as GUI list)
-        def natural_sort_key(job):
-            return [int(text) if text.isdigit() else text.lower()
-                    for text in re.split('([0-9]+)', job.name)]
-        
-        # Sort jobs by name in natural order before finding next PENDING
-        sorted_jobs = sorted(self.jobs.values(), key=natural_sort_key)
-        
-        next_job = None
-        for job in sorted_jobs:
-            if job.status == JobStatus.PENDING:
-                next_job = job
+
+        if self._solve_queue and not self._busy_in("solve"):
+            job = self._solve_queue.popleft()
+            job.status = JobStatus.RUNNING
+            if job.id in self.jobs:
+                self.status_changed.emit(job.id, JobStatus.RUNNING)
+            self._start_stage("solve", job)
+
+        if self._integrate_queue and not self._busy_in("integrate"):
+            self._start_stage("integrate", self._integrate_queue.popleft())
+
+        # Mesh ahead of the solver, but only a bounded number of jobs
+        while (len(self._busy_in("mesh")) < self.MAX_MESH_WORKERS
+               and self._in_flight() - len(self._busy_in("solve")) < self.PIPELINE_DEPTH):
+            job = self._next_pending_job()
+            if job is None:
                 break
-        
-        if next_job:
-            self.worker = AnalysisWorker(next_job, self.config_path, self.temp_dir, self.result_dir)
-            self.worker.progress_updated.connect(self._on_worker_progress)
-            self.worker.log_updated.connect(self._on_worker_log)
-            # Custom signal for status updates
-            self.worker.finished.connect(self._on_worker_finished) 
-            # Standard QThread signal for safe sequencing (wait for thread to actually die)
-            # Note: AnalysisWorker defines 'finished', so accessing QThread.finished requires casting or careful binding?
-            # Actually, AnalysisWorker.finished shadows QThread.finished.
-            # We must rename the custom signal in AnalysisWorker or use a different connection.
-            # But changing AnalysisWorker signature is invasive.
-            # Let's use the 'finished()' from QThread by connecting to the worker itself as a QThread object?
-            # Or simplified: AnalysisWorker emits its custom finished signal at the VERY END of run().
-            # So if we trust run() to return immediately after emitting, the race is small.
-            # However, the previous code had 'return' immediately after emit inside run(), so it should be fine IF we removed the early emit in skip().
-            # Since we did remove the early emit in skip(), the custom signal is now ONLY emitted when run() is returning.
-            # So we can keep using custom signal for sequencing, as isRunning() will flip shortly.
-            # BUT to be 100% safe, let's verify if we need to wait.
-            
-            # Since we fixed skip() to NOT emit finished, the race is resolved.
-            # The finished signal now effectively means "Thread is done".
-            # So start_next_job called from on_worker_finished might still see isRunning=True for a microsecond.
-            # So let's wrap start_next_job call in a small delay or use QTimer.singleShot(0, ...)
-            
-            next_job.status = JobStatus.RUNNING
-            self.status_changed.emit(next_job.id, JobStatus.RUNNING)
-            self.worker.start()
-        else:
+            del self._pending_ids[job.id]
+            job.log_lines.clear()  # a re-run starts a fresh log, like the MeshWorker's log file
+            job.status = JobStatus.MESHING
+            self.status_changed.emit(job.id, JobStatus.MESHING)
+            self._start_stage("mesh", job)
+
+        if self._in_flight() == 0:
             self._batch_running = False
+            self._release_workers()
+            self.batch_finished.emit()
 
     def stop_batch(self):
+        was_running = self._batch_running
         self._batch_running = False
-        if self.worker:
-            self.worker.stop()
+        for worker in self._busy:
+            worker.stop()
+        self._release_workers()
+
+        # Jobs waiting between stages have not started solving; return them to the queue
+        for job in list(self._integrate_queue) + list(self._solve_queue):
+            job.status = JobStatus.PENDING
+            job.progress = 0
+            job.status_text = "Pending"
+            if job.id in self.jobs:
+                self.status_changed.emit(job.id, JobStatus.PENDING)
+        self._integrate_queue.clear()
+        self._solve_queue.clear()
+        if was_running:
+            self._stopping = bool(self._busy)
+            if not self._stopping:
+                self.batch_finished.emit()
 
     def skip_current_job(self):
-        if self.worker and self.worker.isRunning():
-            self.worker.skip()
+        # The job being solved is the "current" one; before the solver starts, skip the oldest mesher
+        for stage in ("solve", "integrate", "mesh"):
+            busy = self._busy_in(stage)
+            if busy:
+                busy[0].skip()
+                return
 
     @Slot(str, int, str)
     def _on_worker_progress(self, job_id, progress, status_text):
@@ -348,30 +559,55 @@ class JobManager(QObject):
             job.status_text = status_text
             self.progress_changed.emit(job_id, progress, status_text)
 
-    @Slot(str, str)
-    def _on_worker_log(self, job_id, line):
+    @Slot(str, list)
+    def _on_worker_log_chunk(self, job_id, lines):
         if job_id in self.jobs:
-            self.jobs[job_id].log_lines.append(line)
-            self.log_added.emit(job_id, line)
+            self.jobs[job_id].log_lines.extend(lines)
+            self.log_chunk.emit(job_id, lines)
 
-    @Slot(str, bool, str)
-    def _on_worker_finished(self, job_id, success, error_message=""):
-        if job_id in self.jobs:
-            job = self.jobs[job_id]
-            if hasattr(self.worker, '_skipped') and self.worker._skipped:
-                job.status = JobStatus.SKIPPED
-            elif hasattr(self.worker, '_stopped') and self.worker._stopped:
-                job.status = JobStatus.STOPPED
-                job.status_text = "Stopped"
-                job.error_message = "Force stopped by user"
-            elif success:
-                job.status = JobStatus.COMPLETED
+    @Slot(str, str, str)
+    def _on_stage_finished(self, job_id, produced_path, error_message):
+        worker = self.sender()
+        self._busy.pop(worker, None)
+
+        job = self.jobs.get(job_id)
+        if (job is not None and worker.stage != "solve" and not self._batch_running
+                and (produced_path or worker._stopped)):
+            # Batch was stopped while this job was only being prepared ahead of the solver
+            # (interrupted or just finished); like the queued jobs, it goes back to the queue
+            job.status = JobStatus.PENDING
+            job.progress = 0
+            job.status_text = "Pending"
+            self.status_changed.emit(job.id, JobStatus.PENDING)
+        elif job is not None:
+            if produced_path and worker.stage == "mesh":
+                self._integrate_queue.append(job)
+            elif produced_path and worker.stage == "integrate":
+                self._solve_queue.append(job)
             else:
-                job.status = JobStatus.ERROR
-                job.error_message = error_message
-            self.status_changed.emit(job_id, job.status)
-        
-        if self._batch_running:
-            # Delay slightly to allow the thread to fully exit and isRunning() to become False
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(100, self.start_next_job)
+                self._finish_job(job, worker, bool(produced_path), error_message)
+
+        if self._stopping and not self._busy:
+            self._stopping = False
+            self.batch_finished.emit()
+        self._advance_pipeline()
+
+    def _finish_job(self, job, worker, success, error_message):
+        if worker._skipped:
+            job.status = JobStatus.SKIPPED
+        elif worker._stopped:
+            job.status = JobStatus.STOPPED
+            job.status_text = "Stopped"
+            job.error_message = "Force stopped by user"
+        elif success:
+            job.status = JobStatus.COMPLETED
+        else:
+            job.status = JobStatus.ERROR
+            job.error_message = error_message
+        self.status_changed.emit(job.id, job.status)
+
+    @Slot()
+    def _on_thread_exited(self):
+        worker = self.sender()
+        self._threads.discard(worker)
+        worker.deleteLater()
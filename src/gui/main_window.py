@@ -1,26 +1,64 @@
 import os
 import sys
-import re
-import glob
+import yaml
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QDockWidget, QListWidget, QListWidgetItem, QStackedWidget, 
+                             QDockWidget, QListView, QStackedWidget, 
                              QPushButton, QLabel, QProgressBar, QStatusBar,
-                             QToolBar, QApplication, QMessageBox)
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QAction, QIcon, QPixmap
+                             QToolBar, QApplication, QMessageBox, QStyle)
+from PySide6.QtCore import Qt, Signal, Slot, QModelIndex, QItemSelectionModel, QTimer, QThreadPool, QUrl
+from PySide6.QtGui import QAction, QIcon, QDesktopServices
 
-from src.gui.models.job_item import JobItem, JobStatus
-from src.gui.file_watcher import InputFolderWatcher
+from src.gui.models.job_item import JobStatus
+from src.gui.models.job_list_model import JobListModel
+from src.gui.file_watcher import InputFolderWatcher, DEFAULT_POLL_INTERVAL
 from src.gui.job_manager import JobManager
 from src.gui.panels.mesh_preview import MeshPreview
 from src.gui.panels.progress_panel import ProgressPanel
-from src.gui.panels.progress_panel import ProgressPanel
-from src.gui.panels.progress_panel import ProgressPanel
-from src.gui.panels.result_viewer import ResultViewer
 from src.gui.about_dialog import AboutDialog
+from src.gui.utils import load_icon, load_scaled_pixmap
 from src.utils.sleep_manager import prevent_sleep, allow_sleep
 import src.version as v
 
+def _preview_kind(status):
+    """Which preview panel a job status is shown with (see MainWindow._show_job)."""
+    if status == JobStatus.PENDING:
+        return "step"
+    if status in (JobStatus.MESHING, JobStatus.RUNNING):
+        return "progress"
+    return "result"
+
+
+# Statuses counted as "completed" in the batch progress bar
+DONE_STATUSES = frozenset((JobStatus.COMPLETED, JobStatus.ERROR, JobStatus.SKIPPED))
+
+
+def _shutdown_background(file_watcher, workers):
+    """Join the file watcher and the stage worker threads (runs on a pool thread at exit)."""
+    # Stop file watcher
+    try:
+        file_watcher.stop()
+    except:
+        pass
+    # Stopped workers kill their FEBio/mesher subprocess and return on their own;
+    # terminate() is only a last resort for a thread that ignores the stop
+    for worker in workers:
+        try:
+            if not worker.wait(5000):
+                worker.terminate()
+                worker.wait(2000)
+        except:
+            pass
+
+
+def _warm_up_viewer_imports():
+    """Import the 3D/plotting stack in the background so the first result click doesn't pay for it."""
+    try:
+        import pyvista  # noqa: F401  (pulls in VTK)
+        import pandas  # noqa: F401
+    except Exception:
+        pass
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -29,8 +67,6 @@ class MainWindow(QMainWindow):
         
         # Stylesheet is now loaded globally via src/gui/styles/dark_theme.qss
         
-        import sys
-        
         # Paths
         if getattr(sys, 'frozen', False):
             # Running as compiled EXE
@@ -45,16 +81,34 @@ class MainWindow(QMainWindow):
         # if os.path.exists(icon_path):
         #     self.setWindowIcon(QIcon(icon_path))
         
+        self.root_dir = root_dir
         self.input_dir = os.path.join(root_dir, "input")
         self.temp_dir = os.path.join(root_dir, "temp")
         self.result_dir = os.path.join(root_dir, "results")
         self.config_path = os.path.join(root_dir, "config", "config.yaml")
 
         self.jobs = {} # id -> JobItem
+        self._prev_status = {}  # id -> last status seen, for the incremental done count
+        self._completed_count = 0
+        self._known_paths = set()  # STEP files in input/ as last seen by the watcher or a refresh
+        self._current_job_id = None  # selected job, updated in on_job_selected
+        self._batch_failures = []  # (job name, reason) of this batch, reported once when it ends
+        # What each preview panel currently shows, keyed by job id first; avoids reloading the same view
+        self._last_loaded = {"mesh": None, "result": None, "progress": None}
+        self._xplt_index = {}  # folder -> names of the .xplt files in it; cleared on every status change
+
+        # Progress/log updates are buffered and applied at most every 50 ms
+        self._pending_progress = {}  # job_id -> (progress, status_text), latest only
+        self._log_job_id = None      # job whose log_lines the progress panel shows
+        self._log_shown = 0          # how many of those lines are already in the panel
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
         
         # Components
         self.job_manager = JobManager(self.input_dir, self.temp_dir, self.result_dir, self.config_path)
-        self.file_watcher = InputFolderWatcher(self.input_dir)
+        self.file_watcher = InputFolderWatcher(self.input_dir, self._load_poll_interval())
         
         self._setup_ui()
         self._setup_toolbar()
@@ -63,9 +117,22 @@ class MainWindow(QMainWindow):
         # Start watching
         self._init_existing_jobs()
         self.file_watcher.start()
+
+        # The viewer modules (VTK, matplotlib, pandas) are imported on first use; warm them up
+        # once the window is on screen
+        QTimer.singleShot(2000, lambda: QThreadPool.globalInstance().start(_warm_up_viewer_imports))
         
         # Start with no job selected (show logo placeholder)
         
+    def _load_poll_interval(self):
+        """watcher.poll_interval from config.yaml (only used when input/ is on a network drive)."""
+        try:
+            with open(self.config_path, "r", encoding="utf-8") as f:
+                conf = yaml.safe_load(f) or {}
+            return float((conf.get("watcher") or {}).get("poll_interval") or DEFAULT_POLL_INTERVAL)
+        except Exception:
+            return DEFAULT_POLL_INTERVAL
+
     def _setup_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -77,29 +144,18 @@ class MainWindow(QMainWindow):
         batch_layout.setContentsMargins(10, 5, 10, 5)
         
         self.batch_label = QLabel("Batch Progress:")
-        self.batch_label.setStyleSheet("font-weight: bold; font-size: 16px;")
+        self.batch_label.setObjectName("batchLabel")
         batch_layout.addWidget(self.batch_label)
         
         self.batch_progress = QProgressBar()
         self.batch_progress.setRange(0, 100)
         self.batch_progress.setValue(0)
         self.batch_progress.setMinimumHeight(25)
-        self.batch_progress.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #555;
-                border-radius: 5px;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 4px;
-            }
-        """)
+        self.batch_progress.setObjectName("batchProgress")
         batch_layout.addWidget(self.batch_progress, 1)
         
         self.batch_status = QLabel("0 / 0 completed")
-        self.batch_status.setStyleSheet("font-size: 12px; margin-left: 10px;")
+        self.batch_status.setObjectName("batchStatus")
         batch_layout.addWidget(self.batch_status)
         
         outer_layout.addWidget(batch_frame)
@@ -113,8 +169,10 @@ class MainWindow(QMainWindow):
         left_panel.setFixedWidth(250)
         
         left_layout.addWidget(QLabel("Jobs"))
-        self.job_list_widget = QListWidget()
-        self.job_list_widget.currentRowChanged.connect(self.on_job_selected)
+        self.job_model = JobListModel(self.jobs, self)
+        self.job_list_widget = QListView()
+        self.job_list_widget.setModel(self.job_model)
+        self.job_list_widget.selectionModel().currentRowChanged.connect(self.on_job_selected)
         left_layout.addWidget(self.job_list_widget)
         
         # Right Panel: Preview (Stacked)
@@ -123,34 +181,31 @@ class MainWindow(QMainWindow):
         # Panel 1: Placeholder/Empty with logo
         self.empty_panel = QLabel()
         self.empty_panel.setAlignment(Qt.AlignCenter)
-        self.empty_panel.setStyleSheet("background-color: #0B0F14;")
+        self.empty_panel.setObjectName("emptyPanel")
         
         # Load logo for placeholder
-        import sys
-        if getattr(sys, 'frozen', False):
-            logo_root = os.path.dirname(sys.executable)
-        else:
-            logo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        logo_path = os.path.join(logo_root, "doc", "VEXIS-CAE-LOGO-LARGE.png")
-        if os.path.exists(logo_path):
-            logo_pix = QPixmap(logo_path).scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        logo_path = os.path.join(self.root_dir, "doc", "VEXIS-CAE-LOGO-LARGE.png")
+        logo_pix = load_scaled_pixmap(logo_path, 400, 400)
+        if not logo_pix.isNull():
             self.empty_panel.setPixmap(logo_pix)
         else:
             self.empty_panel.setText("Select a job to preview")
         
         self.preview_stack.addWidget(self.empty_panel)
         
-        # Panel 2: Mesh Preview
-        self.mesh_panel = MeshPreview()
-        self.preview_stack.addWidget(self.mesh_panel)
+        # Panel 2: Mesh Preview (created on first use, see _ensure_mesh_panel)
+        self.mesh_panel = None
+        self._mesh_placeholder = QWidget()
+        self.preview_stack.addWidget(self._mesh_placeholder)
         
         # Panel 3: Progress/Log
         self.progress_panel = ProgressPanel()
         self.preview_stack.addWidget(self.progress_panel)
         
-        # Panel 4: Result Viewer
-        self.result_panel = ResultViewer()
-        self.preview_stack.addWidget(self.result_panel)
+        # Panel 4: Result Viewer (created on first use; its VTK render window is expensive)
+        self.result_panel = None
+        self._result_placeholder = QWidget()
+        self.preview_stack.addWidget(self._result_placeholder)
         
         main_layout.addWidget(left_panel)
         main_layout.addWidget(self.preview_stack, 1)
@@ -161,15 +216,30 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
 
+    def _swap_placeholder(self, placeholder, panel):
+        index = self.preview_stack.indexOf(placeholder)
+        self.preview_stack.insertWidget(index, panel)
+        self.preview_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+    def _ensure_mesh_panel(self):
+        if self.mesh_panel is None:
+            self.mesh_panel = MeshPreview()
+            self._swap_placeholder(self._mesh_placeholder, self.mesh_panel)
+        return self.mesh_panel
+
+    def _ensure_result_panel(self):
+        if self.result_panel is None:
+            from src.gui.panels.result_viewer import ResultViewer  # imports VTK and matplotlib
+            self.result_panel = ResultViewer()
+            self._swap_placeholder(self._result_placeholder, self.result_panel)
+        return self.result_panel
+
     def _setup_toolbar(self):
         toolbar = QToolBar("Main Toolbar")
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
         
-        # Import shared icon loader with caching
-        from src.gui.utils import load_icon
-        from PySide6.QtWidgets import QStyle
-        
         # Define toolbar actions with (icon_name, fallback, label, handler, enabled)
         actions = [
             ("start", QStyle.SP_MediaPlay, "Start Batch", self.on_start_clicked, True),
@@ -189,12 +259,14 @@ class MainWindow(QMainWindow):
         
         # Create actions from definition
         self.run_action = self.stop_action = self.skip_action = None
+        toggled = {"Start Batch", "Stop", "Skip"}  # enabled/disabled at runtime: need a disabled icon
         for item in actions:
             if item is None:
                 toolbar.addSeparator()
             else:
                 icon_name, fallback, label, handler, enabled = item
-                action = QAction(load_icon(icon_name, fallback, self.style()), label, self)
+                icon = load_icon(icon_name, fallback, self.style(), need_disabled=label in toggled)
+                action = QAction(icon, label, self)
                 action.setEnabled(enabled)
                 action.triggered.connect(handler)
                 toolbar.addAction(action)
@@ -219,70 +291,162 @@ class MainWindow(QMainWindow):
 
 
     def _connect_signals(self):
-        self.file_watcher.file_added.connect(self.job_manager.add_job_from_path)
-        self.file_watcher.file_removed.connect(self.job_manager.remove_job_by_path)
+        self.file_watcher.files_changed.connect(self._on_files_changed)
         
-        self.job_manager.job_added.connect(self._on_job_added)
-        self.job_manager.job_removed.connect(self._on_job_removed)
+        self.job_manager.jobs_added.connect(self._on_jobs_added)
+        self.job_manager.jobs_removed.connect(self._on_jobs_removed)
         self.job_manager.status_changed.connect(self._on_job_status_changed)
         self.job_manager.progress_changed.connect(self._on_job_progress_changed)
-        self.job_manager.log_added.connect(self._on_job_log_added)
+        self.job_manager.log_chunk.connect(self._on_job_log_chunk, Qt.QueuedConnection)
+        self.job_manager.batch_finished.connect(self._on_batch_finished)
 
     def _init_existing_jobs(self):
-        for path in self.file_watcher.get_existing_files():
-            self.job_manager.add_job_from_path(path)
+        self._known_paths = set(self.file_watcher.get_existing_files())
+        self.job_manager.add_jobs_from_paths(self._known_paths)
+
+    @Slot(list, list)
+    def _on_files_changed(self, added, removed):
+        # One repaint per burst of watcher events (e.g. many files dropped into input/ at once)
+        selection = self.job_list_widget.selectionModel()
+        self.job_list_widget.setUpdatesEnabled(False)
+        was_blocked = selection.blockSignals(True)
+        self.job_manager.remove_jobs_by_paths(removed)
+        self.job_manager.add_jobs_from_paths(added)
+        self._known_paths.difference_update(removed)
+        self._known_paths.update(added)
+        selection.blockSignals(was_blocked)
+        self.job_list_widget.setUpdatesEnabled(True)
+
+    @Slot(list)
+    def _on_jobs_added(self, jobs):
+        current_id = self._current_job_id
+        self.job_list_widget.setUpdatesEnabled(False)
+        for job in jobs:
+            self._register_job(job)
+        self.job_model.add_jobs(jobs)
+        self._restore_current_job(current_id)
+        self.job_list_widget.setUpdatesEnabled(True)
+        self._update_batch_progress()
 
-    @Slot(JobItem)
-    def _on_job_added(self, job):
+    def _register_job(self, job):
         self.jobs[job.id] = job
-        self._refresh_list_ui()
+        self._track_status(job.id, job.status)
+        # Result locations are fixed per job; build them once instead of on every selection
+        base = job.name
+        job.xplt_candidates = (
+            os.path.join(self.result_dir, f"{base}.xplt"),
+            os.path.join(self.temp_dir, f"{base}.xplt"),
+            os.path.join(os.getcwd(), "results", f"{base}.xplt"),
+            os.path.join(os.getcwd(), "temp", f"{base}.xplt"),
+        )
 
-    @Slot(str)
-    def _on_job_removed(self, job_id):
-        if job_id in self.jobs:
+    @Slot(list)
+    def _on_jobs_removed(self, job_ids):
+        job_ids = [job_id for job_id in job_ids if job_id in self.jobs]
+        if not job_ids:
+            return
+        for job_id in job_ids:
             del self.jobs[job_id]
-            self._refresh_list_ui()
+            if self._prev_status.pop(job_id, None) in DONE_STATUSES:
+                self._completed_count -= 1
+        current_id = self._current_job_id
+        selection = self.job_list_widget.selectionModel()
+        was_blocked = selection.blockSignals(True)
+        self.job_model.remove_jobs(job_ids)
+        if current_id in self.jobs:
+            self._restore_current_job(current_id)
+        else:
+            selection.clear()
+            self._current_job_id = None
+        selection.blockSignals(was_blocked)
+        self.job_list_widget.viewport().update()
+        self._update_batch_progress()
 
-    @Slot(str, JobStatus)
+    @Slot(str, object)
     def _on_job_status_changed(self, job_id, status):
-        for i in range(self.job_list_widget.count()):
-            item = self.job_list_widget.item(i)
-            if item.data(Qt.UserRole) == job_id:
-                job = self.jobs[job_id]
-                item.setText(f"{job.name} [{job.display_status()}]")
-                break
+        if job_id not in self.jobs:
+            return  # the file was removed; don't start tracking it again
+        old_status = self._prev_status.get(job_id)
+        if old_status == status:
+            return  # repeated emit, nothing to refresh
+        self.job_model.job_changed(job_id)
+        self._track_status(job_id, status)
+        # A status transition may have produced or removed files; reload this job's views next time
+        self.jobs[job_id].has_result = None
+        self._xplt_index.clear()
+        for panel, key in self._last_loaded.items():
+            if key is not None and key[0] == job_id:
+                self._last_loaded[panel] = None
+        if status == JobStatus.MESHING and job_id == self._log_job_id:
+            # The job's log_lines were cleared for a re-run; rebuild the panel instead of appending
+            self._log_job_id = None
+            self._log_shown = 0
         
         # Update batch progress
         self._update_batch_progress()
 
+        # Failures are collected and reported in one dialog when the batch ends, so a modal
+        # dialog per job does not hold up the remaining status/progress updates
         if status == JobStatus.ERROR:
             job = self.jobs[job_id]
             err_msg = getattr(job, 'error_message', 'Unknown Error')
-            QMessageBox.critical(self, "Analysis Error", f"Job '{job.name}' Failed.\n\nError: {err_msg}")
+            self._batch_failures.append((job.name, f"Error: {err_msg}"))
         elif status == JobStatus.STOPPED:
             job = self.jobs[job_id]
-            QMessageBox.information(self, "Analysis Stopped", f"Job '{job.name}' was stopped by user.")
+            self._batch_failures.append((job.name, "Stopped by user"))
         
-        current_job_id = self._get_current_job_id()
-        if current_job_id == job_id:
-            self.on_job_selected(self.job_list_widget.currentRow())
+        # The selected job keeps its row; only switch panels when the kind of preview changes
+        if self._current_job_id == job_id and _preview_kind(old_status) != _preview_kind(status):
+            self._show_job(self.jobs[job_id])
+
+    @Slot()
+    def _on_batch_finished(self):
+        failures, self._batch_failures = self._batch_failures, []
+        if not failures:
+            return
+        details = "\n".join(f"・ {name}: {reason}" for name, reason in failures)
+        if any(reason != "Stopped by user" for _, reason in failures):
+            QMessageBox.critical(self, "Analysis Error", f"{len(failures)} job(s) did not complete.\n\n{details}")
+        else:
+            QMessageBox.information(self, "Analysis Stopped", f"{len(failures)} job(s) were stopped by user.\n\n{details}")
 
     @Slot(str, int, str)
     def _on_job_progress_changed(self, job_id, progress, status_text):
-        if self._get_current_job_id() == job_id:
-            job = self.jobs[job_id]
-            self.progress_panel.set_job_info(job.name, status_text, progress)
+        if job_id != self._current_job_id:
+            return  # only the selected job is shown; JobManager keeps the others' state
+        self._pending_progress[job_id] = (progress, status_text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot(str, list)
+    def _on_job_log_chunk(self, job_id, lines):
+        if job_id != self._current_job_id:
+            return  # the lines are kept in job.log_lines and shown when the job is selected
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def _flush_pending(self):
+        """Apply the buffered progress/log updates of the selected job in one go."""
+        current_job_id = self._current_job_id
+        progress = self._pending_progress.get(current_job_id)
+        self._pending_progress.clear()
 
-    @Slot(str, str)
-    def _on_job_log_added(self, job_id, line):
-        if self._get_current_job_id() == job_id: # Corrected from 'current_job_id' to 'self._get_current_job_id()'
-             self.progress_panel.append_log(line)
+        if progress is not None and current_job_id in self.jobs:
+            self._show_progress_info(self.jobs[current_job_id], progress[1], progress[0])
+        if self._log_job_id == current_job_id and current_job_id in self.jobs:
+            self._sync_log(self.jobs[current_job_id])
 
     @Slot()
     def on_about_clicked(self):
         dlg = AboutDialog(self)
         dlg.exec()
 
+    def _track_status(self, job_id, status):
+        was_done = self._prev_status.get(job_id) in DONE_STATUSES
+        self._completed_count += (status in DONE_STATUSES) - was_done
+        self._prev_status[job_id] = status
+
     def _update_batch_progress(self):
         total = len(self.jobs)
         if total == 0:
@@ -290,91 +454,118 @@ class MainWindow(QMainWindow):
             self.batch_status.setText("0 / 0 completed")
             return
         
-        completed = sum(1 for j in self.jobs.values() 
-                       if j.status in [JobStatus.COMPLETED, JobStatus.ERROR, JobStatus.SKIPPED])
+        completed = self._completed_count
         percent = int((completed / total) * 100)
         self.batch_progress.setValue(percent)
         self.batch_status.setText(f"{completed} / {total} completed")
 
-    def _refresh_list_ui(self):
-        current_id = self._get_current_job_id()
-        self.job_list_widget.blockSignals(True)
-        self.job_list_widget.clear()
-        
-        def natural_sort_key(s):
-            return [int(text) if text.isdigit() else text.lower()
-                    for text in re.split('([0-9]+)', s)]
-        
-        sorted_jobs = sorted(self.jobs.values(), key=lambda j: natural_sort_key(j.name))
-        
-        for job in sorted_jobs:
-            list_item = QListWidgetItem(f"{job.name} [{job.display_status()}]")
-            list_item.setData(Qt.UserRole, job.id)
-            self.job_list_widget.addItem(list_item)
-            
-            if job.id == current_id:
-                self.job_list_widget.setCurrentItem(list_item)
-                
-        self.job_list_widget.blockSignals(False)
-        self._update_batch_progress()
-
-    def _get_current_job_id(self):
-        row = self.job_list_widget.currentRow()
-        if row < 0: return None
-        return self.job_list_widget.item(row).data(Qt.UserRole)
+    def _restore_current_job(self, job_id):
+        """Re-select a job after a model reset without re-running on_job_selected."""
+        row = self.job_model.row_of(job_id)
+        if row < 0:
+            self._current_job_id = None
+            return
+        if self.job_list_widget.currentIndex().row() == row:
+            return
+        selection = self.job_list_widget.selectionModel()
+        was_blocked = selection.blockSignals(True)
+        selection.setCurrentIndex(self.job_model.index(row, 0), QItemSelectionModel.ClearAndSelect)
+        selection.blockSignals(was_blocked)
+        self.job_list_widget.viewport().update()
 
-    @Slot(int)
+    @Slot(QModelIndex)
     def on_job_selected(self, index):
-        if index < 0:
+        if index.row() < 0:
+            self._current_job_id = None
             self.preview_stack.setCurrentIndex(0)
             return
             
-        item = self.job_list_widget.item(index)
-        job_id = item.data(Qt.UserRole)
-        job = self.jobs.get(job_id)
+        job = self.job_model.job_at(index.row())
         
         if not job:
+            self._current_job_id = None
             self.preview_stack.setCurrentIndex(0)
             return
+        self._current_job_id = job.id
+        self._show_job(job)
 
+    def _show_job(self, job):
+        """Show the preview panel matching the job's status."""
         # Priority 1: PENDING jobs always show STEP preview
         if job.status == JobStatus.PENDING:
-            self.preview_stack.setCurrentWidget(self.mesh_panel)
-            self.mesh_panel.load_step(job.step_path)
+            self._show_step_preview(job)
             return
             
-        # Priority 2: RUNNING jobs show progress/log panel
-        if job.status == JobStatus.RUNNING:
+        # Priority 2: MESHING/RUNNING jobs show progress/log panel
+        if job.status in (JobStatus.MESHING, JobStatus.RUNNING):
             self.preview_stack.setCurrentWidget(self.progress_panel)
-            self.progress_panel.set_job_info(job.name, job.status_text, job.progress)
+            self._show_progress_info(job, job.status_text, job.progress)
+            self._sync_log(job)
             return
 
         # Priority 3: For COMPLETED/SKIPPED/STOPPED/ERROR - check if result file exists
-        import os
-        base = job.name
-        possible_paths = [
-            os.path.join(self.result_dir, f"{base}.xplt"),
-            os.path.join(self.temp_dir, f"{base}.xplt"),
-            os.path.join(os.getcwd(), "results", f"{base}.xplt"),
-            os.path.join(os.getcwd(), "temp", f"{base}.xplt"),
-        ]
-        
-        has_result = False
-        if job.result_path and os.path.exists(job.result_path):
-             has_result = True
-        else:
-            for p in possible_paths:
-                if p and os.path.exists(p):
-                    has_result = True
-                    break
+        # (cached on the job until its status changes again)
+        if job.has_result is None:
+            job.xplt_path = next((p for p in job.xplt_candidates if self._xplt_exists(p)), None)
+            job.has_result = job.xplt_path is not None or bool(
+                job.result_path and os.path.exists(job.result_path))
             
-        if has_result:
-            self.preview_stack.setCurrentWidget(self.result_panel)
-            self.result_panel.load_result(job.name, self.result_dir, self.temp_dir)
+        if job.has_result:
+            self.preview_stack.setCurrentWidget(self._ensure_result_panel())
+            key = (job.id, job.name)
+            if self._last_loaded["result"] != key:
+                self.result_panel.load_result(job.name, self.result_dir, self.temp_dir,
+                                              xplt_path=job.xplt_path)
+                self._last_loaded["result"] = key
         else:
             # No result file - show STEP as fallback
-            self.preview_stack.setCurrentWidget(self.mesh_panel)
+            self._show_step_preview(job)
+
+    def _xplt_exists(self, path):
+        """Existence check against a per-folder listing, so a selection costs no stat per candidate."""
+        folder, name = os.path.split(path)
+        names = self._xplt_index.get(folder)
+        if names is None:
+            names = set()
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.name.endswith(".xplt") and entry.is_file():
+                            names.add(entry.name)
+            except OSError:
+                pass
+            self._xplt_index[folder] = names
+        return name in names
+
+    def _show_step_preview(self, job):
+        self.preview_stack.setCurrentWidget(self._ensure_mesh_panel())
+        # The watcher reports no edits in place, so the file's stamp is part of the key
+        try:
+            st = os.stat(job.step_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        key = (job.id, job.step_path, stamp)
+        if self._last_loaded["mesh"] != key:
             self.mesh_panel.load_step(job.step_path)
+            self._last_loaded["mesh"] = key
+
+    def _show_progress_info(self, job, status_text, progress):
+        key = (job.id, job.name, status_text, progress)
+        if self._last_loaded["progress"] != key:
+            self.progress_panel.set_job_info(job.name, status_text, progress)
+            self._last_loaded["progress"] = key
+
+    def _sync_log(self, job):
+        """Bring the progress panel's log up to date with job.log_lines in a single update."""
+        lines = job.log_lines
+        if self._log_job_id != job.id:
+            # Another job's log is shown: replace it with this job's log so far
+            self.progress_panel.set_log(lines)
+            self._log_job_id = job.id
+        elif len(lines) > self._log_shown:
+            self.progress_panel.append_log("\n".join(lines[self._log_shown:]))
+        self._log_shown = len(lines)
 
     def on_start_clicked(self):
         # Validate filenames (ASCII check)
@@ -392,6 +583,7 @@ class MainWindow(QMainWindow):
         self.run_action.setEnabled(False)
         self.stop_action.setEnabled(True)
         self.skip_action.setEnabled(True)
+        self._batch_failures = []
         self.job_manager.start_batch()
 
 
@@ -405,23 +597,37 @@ class MainWindow(QMainWindow):
         self.job_manager.skip_current_job()
 
     def on_refresh_clicked(self):
-        self._init_existing_jobs()
+        # Result files may have been copied in by hand; look them up again on the next selection
+        self._xplt_index.clear()
+        for job in self.jobs.values():
+            job.has_result = None
+        # Only apply what changed since the last scan/watcher event
+        current = set(self.file_watcher.get_existing_files())
+        added = current - self._known_paths
+        removed = self._known_paths - current
+        if added or removed:
+            self._on_files_changed(list(added), list(removed))
+        self._known_paths = current
 
     def on_edit_config_clicked(self):
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
-            os.path.abspath(__file__)))), "config", "config.yaml")
-        self._open_in_editor(config_path)
+        self._open_in_editor(self.config_path)
 
     def on_edit_material_clicked(self):
-        material_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
-            os.path.abspath(__file__)))), "config", "material.yaml")
-        self._open_in_editor(material_path)
+        self._open_in_editor(os.path.join(self.root_dir, "config", "material.yaml"))
 
     def _open_in_editor(self, file_path):
-        import subprocess
         if os.path.exists(file_path):
-            # Windows: use notepad
-            subprocess.Popen(["notepad.exe", file_path])
+            if sys.platform == 'win32':
+                # ShellExecute returns at once and honours the user's editor for .yaml
+                try:
+                    os.startfile(file_path, 'edit')
+                    return
+                except OSError:
+                    pass  # no "edit" verb registered for this file type
+            # Otherwise the OS file association (xdg-open / Launch Services / ShellExecute "open")
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(file_path)) and sys.platform == 'win32':
+                import subprocess
+                subprocess.Popen(["notepad.exe", file_path])  # .yaml not associated with anything
         else:
             QMessageBox.warning(self, "File Not Found", f"Config file not found:\n{file_path}")
 
@@ -457,21 +663,17 @@ class MainWindow(QMainWindow):
             
             # Stop all background processes
             self.status_bar.showMessage("Shutting down...")
+            self.hide()
             
-            # Stop file watcher
-            try:
-                self.file_watcher.stop()
-            except:
-                pass
-            
-            # Stop batch processing and worker threads
+            # Ask the batch to stop (GUI-thread state), then do the blocking joins/waits off the UI thread
+            workers = []
             try:
                 self.job_manager.stop_batch()
-                if self.job_manager.worker and self.job_manager.worker.isRunning():
-                    self.job_manager.worker.terminate()
-                    self.job_manager.worker.wait(2000)
+                workers = self.job_manager.running_workers()
             except:
                 pass
+            file_watcher = self.file_watcher
+            QThreadPool.globalInstance().start(lambda: _shutdown_background(file_watcher, workers))
             
             # Clean up pyvista plotters
             try:
@@ -1,6 +1,8 @@
+import re
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 class JobStatus(Enum):
     PENDING = auto()
@@ -11,11 +13,26 @@ class JobStatus(Enum):
     SKIPPED = auto()
     STOPPED = auto()
 
-@dataclass
+_NATURAL_SPLIT_RE = re.compile(r'([0-9]+)')
+# Typical job names are "<text><number>" (case_0, case_12); their key is just (text, number)
+_NAME_NUMBER_RE = re.compile(r'([^0-9]*)([0-9]+)')
+
+_STATUS_LABELS = {
+    JobStatus.PENDING: "Pending",
+    JobStatus.MESHING: "Meshing...",
+    JobStatus.RUNNING: "Analyzing...",
+    JobStatus.COMPLETED: "Completed",
+    JobStatus.ERROR: "Error",
+    JobStatus.SKIPPED: "Skipped",
+    JobStatus.STOPPED: "Stopped"
+}
+
+@dataclass(slots=True)  # no per-instance __dict__; job lists can hold thousands of items
 class JobItem:
     id: str
     name: str
     step_path: str
+    canonical_path: Optional[str] = None  # normcase(realpath(step_path)), duplicate-detection key
     status: JobStatus = JobStatus.PENDING
     progress: int = 0
     status_text: str = "Pending"
@@ -24,15 +41,42 @@ class JobItem:
     result_path: Optional[str] = None
     error_message: Optional[str] = None
     log_lines: List[str] = field(default_factory=list)
+    xplt_candidates: Tuple[str, ...] = ()  # where a result .xplt may be, filled in when the GUI lists the job
+    has_result: Optional[bool] = None  # cached existence of any candidate; None = not checked since last status change
+    xplt_path: Optional[str] = None  # the candidate found by that check
+    # Natural sort key of name, computed once (names never change after creation)
+    sort_key: Tuple = field(default=(), init=False, repr=False, compare=False)
+    # List label cache, rebuilt only when status differs from the one it was built for
+    _label: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _label_status: Optional[JobStatus] = field(default=None, init=False, repr=False, compare=False)
     
+    def __post_init__(self):
+        # The id is the key of every job dict and signal payload; interned strings hash/compare faster
+        self.id = sys.intern(self.id)
+        self.sort_key = _natural_key(self.name)
+
     def display_status(self) -> str:
-        status_map = {
-            JobStatus.PENDING: "Pending",
-            JobStatus.MESHING: "Meshing...",
-            JobStatus.RUNNING: "Analyzing...",
-            JobStatus.COMPLETED: "Completed",
-            JobStatus.ERROR: "Error",
-            JobStatus.SKIPPED: "Skipped",
-            JobStatus.STOPPED: "Stopped"
-        }
-        return status_map.get(self.status, "Unknown")
+        return _STATUS_LABELS.get(self.status, "Unknown")
+
+    @property
+    def label(self) -> str:
+        """Job list text, e.g. "case_1 [Completed]"."""
+        if self._label_status is not self.status:
+            self._label = f"{self.name} [{self.display_status()}]"
+            self._label_status = self.status
+        return self._label
+
+
+def _natural_key(name):
+    """("case_", 12) for "case_12"; the general form interleaves text and numbers."""
+    simple = _NAME_NUMBER_RE.fullmatch(name)
+    if simple:
+        # Same as the general key minus its trailing "", so both forms sort consistently
+        return (simple.group(1).lower(), int(simple.group(2)))
+    return tuple(int(text) if text.isdigit() else text.lower()
+                 for text in _NATURAL_SPLIT_RE.split(name))
+
+
+def natural_sort_key(job: JobItem):
+    """Natural sort key on the job name (case_2 before case_10); shared by the job list and the batch order."""
+    return job.sort_key
@@ -0,0 +1,114 @@
+import bisect
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.gui.models.job_item import natural_sort_key
+
+
+class JobListModel(QAbstractListModel):
+    """
+    Job list shown in the main window, in natural name order.
+
+    Rows hold the JobItem objects themselves (no per-row id payload); a job id is
+    mapped to its row through a dict, so status updates never scan the list.
+    """
+
+    INSERT_ROWS_LIMIT = 32  # larger bursts into a non-empty list rebuild the rows in one reset
+
+    def __init__(self, jobs, parent=None):
+        super().__init__(parent)
+        self._jobs = jobs  # id -> JobItem (MainWindow.jobs), used for full rebuilds
+        self._items = []   # JobItems in display order
+        self._keys = []    # natural_sort_key of each row, parallel to _items (for bisect)
+        self._row = {}     # job id -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._items[index.row()].label
+        return None
+
+    def row_of(self, job_id):
+        """Row of a job, or -1 if it is not listed."""
+        return self._row.get(job_id, -1)
+
+    def job_at(self, row):
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def add_job(self, job):
+        """Insert one job at its natural-sort position."""
+        key = natural_sort_key(job)
+        row = bisect.bisect_right(self._keys, key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.insert(row, job)
+        self._keys.insert(row, key)
+        self._reindex(row)
+        self.endInsertRows()
+
+    def add_jobs(self, jobs):
+        """Insert many jobs: row inserts for a few, one model notification for the rest."""
+        if not jobs:
+            return
+        if self._items:
+            # New jobs interleave with the listed ones; insert a few in place (the view keeps
+            # its selection and scroll position), rebuild once for a big burst
+            if len(jobs) > self.INSERT_ROWS_LIMIT:
+                self.reset()
+                return
+            for job in jobs:
+                self.add_job(job)
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(jobs) - 1)
+        self._set_items(jobs)
+        self.endInsertRows()
+
+    def remove_job(self, job_id):
+        """Remove one row; rows below it shift up by one."""
+        row = self._row.pop(job_id, None)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[row]
+        del self._keys[row]
+        for following in self._items[row:]:
+            self._row[following.id] -= 1
+        self.endRemoveRows()
+
+    def remove_jobs(self, job_ids):
+        """Remove many rows with one model notification."""
+        if len(job_ids) == 1:
+            self.remove_job(job_ids[0])
+            return
+        gone = set(job_ids)
+        self.beginResetModel()
+        self._set_items([job for job in self._items if job.id not in gone])
+        self.endResetModel()
+
+    def job_changed(self, job_id):
+        """Repaint the row of a job whose status text changed."""
+        row = self._row.get(job_id)
+        if row is not None:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def reset(self):
+        """Rebuild the rows from the job dict (one model reset)."""
+        self.beginResetModel()
+        self._set_items(self._jobs.values())
+        self.endResetModel()
+
+    def _set_items(self, jobs):
+        self._items = sorted(jobs, key=natural_sort_key)
+        self._keys = [job.sort_key for job in self._items]
+        self._row = {}
+        self._reindex(0)
+
+    def _reindex(self, start):
+        for row in range(start, len(self._items)):
+            self._row[self._items[row].id] = row
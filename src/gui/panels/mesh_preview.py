@@ -1,7 +1,12 @@
+import atexit
+import hashlib
 import os
 import tempfile
+from collections import OrderedDict
+
+import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, Slot
 
 # Lazy import to avoid OpenGL context conflicts
 PYVISTA_AVAILABLE = False
@@ -21,43 +26,178 @@ def _ensure_pyvista():
             PYVISTA_AVAILABLE = False
     return PYVISTA_AVAILABLE
 
-def _step_to_temp_mesh(step_path):
-    """Convert STEP file to temporary VTK mesh for visualization using gmsh."""
-    try:
-        import gmsh
-        gmsh.initialize()
+# Preview triangle budget: decimate above this, and drop the feature-edge overlay above the second
+DECIMATE_CELLS = 200_000
+EDGES_MAX_CELLS = 500_000
+
+# Tessellated previews persist across sessions here, keyed by (step_path, mtime_ns, size)
+_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), "vexis_preview_cache")
+DISK_CACHE_MAX_BYTES = 512 * 1024 * 1024  # least recently used previews are deleted beyond this
+
+_GMSH_INITIALIZED = False
+
+def _gmsh_init():
+    """Start the preview's gmsh session once; later previews reuse it (finalized at exit)."""
+    global _GMSH_INITIALIZED
+    import gmsh
+    if not _GMSH_INITIALIZED:
+        try:
+            # Runs on a pool thread, where Python cannot install gmsh's SIGINT handler
+            gmsh.initialize(interruptible=False)
+        except TypeError:  # older gmsh without the flag
+            gmsh.initialize()
         gmsh.option.setNumber("General.Terminal", 0)  # Suppress output
+        atexit.register(gmsh.finalize)
+        _GMSH_INITIALIZED = True
+    return gmsh
+
+def _step_to_surface(step_path):
+    """Tessellate a STEP file with gmsh and return the surface triangles as a pv.PolyData."""
+    try:
+        gmsh = _gmsh_init()
         gmsh.model.add("preview")
         gmsh.model.occ.importShapes(step_path)
         gmsh.model.occ.synchronize()
         
-        # Fine mesh for smooth preview
-        gmsh.option.setNumber("Mesh.MeshSizeMin", 0.1)
-        gmsh.option.setNumber("Mesh.MeshSizeMax", 0.3)
+        # Fine mesh for smooth preview; large parts get a size relative to their extent
+        # so the triangle count (and meshing time) stays bounded
+        xmin, ymin, zmin, xmax, ymax, zmax = gmsh.model.getBoundingBox(-1, -1)
+        diag = ((xmax - xmin) ** 2 + (ymax - ymin) ** 2 + (zmax - zmin) ** 2) ** 0.5
+        size_max = max(0.3, diag / 40)
+        gmsh.option.setNumber("Mesh.MeshSizeMin", size_max / 3)
+        gmsh.option.setNumber("Mesh.MeshSizeMax", size_max)
         gmsh.option.setNumber("Mesh.Algorithm", 6)  # Frontal-Delaunay for better quality
         gmsh.model.mesh.generate(2)  # Surface mesh only for speed
         
-        # Save to temp file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".vtk", delete=False)
-        temp_path = temp_file.name
-        temp_file.close()
-        gmsh.write(temp_path)
-        gmsh.finalize()
-        return temp_path
+        # Take the triangles straight from the API (no .vtk written and read back)
+        node_tags, coords, _ = gmsh.model.mesh.getNodes()
+        _, tri_node_tags = gmsh.model.mesh.getElementsByType(2)  # 3-node triangles
     except Exception as e:
         print(f"STEP preview generation error: {e}")
+        return None
+    finally:
+        # Drop this file's model but keep the session for the next preview
+        if _GMSH_INITIALIZED:
+            try:
+                gmsh.clear()
+            except Exception:
+                pass
+
+    node_tags = np.asarray(node_tags, dtype=np.int64)
+    if node_tags.size == 0 or len(tri_node_tags) == 0:
+        print(f"STEP preview generation error: no surface triangles in {step_path}")
+        return None
+    # gmsh node tags are not necessarily contiguous; map them to point indices
+    index = np.empty(node_tags.max() + 1, dtype=np.int64)
+    index[node_tags] = np.arange(node_tags.size)
+    triangles = index[np.asarray(tri_node_tags, dtype=np.int64)].reshape(-1, 3)
+    faces = np.hstack([np.full((len(triangles), 1), 3, dtype=np.int64), triangles]).ravel()
+    return pv.PolyData(np.asarray(coords, dtype=float).reshape(-1, 3), faces)
+
+
+def _disk_cache_path(cache_key):
+    digest = hashlib.blake2b(repr(cache_key).encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(_DISK_CACHE_DIR, f"{digest}.vtp")
+
+def _read_cached_surface(cache_key):
+    """Return the surface saved for this STEP file version by an earlier session, or None."""
+    path = _disk_cache_path(cache_key)
+    try:
+        mesh = pv.read(path)
+        os.utime(path)  # mark as recently used for _trim_disk_cache
+        return mesh
+    except Exception:
+        return None
+
+def _write_cached_surface(cache_key, mesh):
+    path = _disk_cache_path(cache_key)
+    tmp_path = f"{path[:-4]}.{os.getpid()}.vtp"
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        mesh.save(tmp_path, binary=True)
+        os.replace(tmp_path, path)  # readers never see a half-written file
+        _trim_disk_cache()
+    except Exception as e:
+        print(f"STEP preview cache write error: {e}")
         try:
-            gmsh.finalize()
-        except:
+            os.remove(tmp_path)
+        except OSError:
             pass
-        return None
+
+def _trim_disk_cache():
+    """Delete the least recently used previews once the cache exceeds DISK_CACHE_MAX_BYTES."""
+    with os.scandir(_DISK_CACHE_DIR) as it:
+        files = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in it if e.name.endswith(".vtp")]
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= DISK_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+class _StepMeshSignals(QObject):
+    finished = Signal(object, object, str)  # cache_key, (surface, feature_edges) or None, error_message
+
+
+class StepMeshTask(QRunnable):
+    """Tessellates a STEP file off the GUI thread (gmsh surface mesh + feature edges)."""
+
+    def __init__(self, step_path, cache_key):
+        super().__init__()
+        self.step_path = step_path
+        self.cache_key = cache_key
+        self.signals = _StepMeshSignals()
+
+    def run(self):
+        try:
+            # Seen in an earlier session: skip gmsh entirely
+            mesh = _read_cached_surface(self.cache_key)
+            if mesh is None:
+                mesh = _step_to_surface(self.step_path)
+                if mesh is None:
+                    self.signals.finished.emit(self.cache_key, None, "Failed to load STEP geometry")
+                    return
+                # Keep the GPU load bounded on very detailed parts
+                if mesh.n_cells > DECIMATE_CELLS:
+                    mesh = mesh.decimate_pro(0.5, preserve_topology=True)
+                _write_cached_surface(self.cache_key, mesh)
+            # Extract only feature edges (outer boundary and sharp edges);
+            # dense parts get fewer, sharper edges, and huge ones none at all
+            if mesh.n_cells > EDGES_MAX_CELLS:
+                edges = None
+            else:
+                edges = mesh.extract_feature_edges(
+                    boundary_edges=True, 
+                    feature_edges=True, 
+                    manifold_edges=False,
+                    non_manifold_edges=False,
+                    feature_angle=45 if mesh.n_cells > DECIMATE_CELLS // 2 else 30
+                )
+        except Exception as e:
+            print(f"STEP Preview Error: {e}")
+            self.signals.finished.emit(self.cache_key, None, f"Preview error: {str(e)}")
+            return
+        self.signals.finished.emit(self.cache_key, (mesh, edges), "")
+
 
 class MeshPreview(QWidget):
+    STEP_CACHE_SIZE = 8  # tessellated STEP previews kept in memory
+
     def __init__(self):
         super().__init__()
         self.plotter = None
         self._initialized = False
-        self._temp_file = None
+        # (step_path, mtime_ns, size) -> (surface, feature_edges), least recently shown first
+        self._step_cache = OrderedDict()
+        # gmsh is not thread-safe: one tessellation at a time, off the GUI thread
+        self._step_pool = QThreadPool(self)
+        self._step_pool.setMaxThreadCount(1)
+        self._step_tasks = {}  # cache_key -> StepMeshTask queued or running
+        self._pending_step = None  # cache_key of the STEP file that should be on screen
         self.layout = QVBoxLayout(self)
         
         self.placeholder = QLabel("Geometry Preview\n(Select a job)")
@@ -76,13 +216,12 @@ class MeshPreview(QWidget):
         self.placeholder.hide()
         self.plotter = QtInteractor(self)
         self.layout.addWidget(self.plotter)
-        self.layout.addWidget(self.plotter)
         # Deep Dark Gradient Background (matches QSS Theme)
         self.plotter.set_background("#0B0F14", top="#141E2A")
 
     def load_mesh(self, vtk_path):
         """Load mesh file for preview."""
-        self._cleanup_temp()
+        self._pending_step = None
         
         if not os.path.exists(vtk_path):
             self.placeholder.setText("Mesh not available")
@@ -107,30 +246,63 @@ class MeshPreview(QWidget):
             print(f"Mesh Preview Error: {e}")
 
     def load_step(self, step_path):
-        """Load STEP file for geometry preview (converts to temp mesh)."""
-        self._cleanup_temp()
-        
-        if not os.path.exists(step_path):
+        """Load STEP file for geometry preview (tessellated in the background)."""
+        try:
+            st = os.stat(step_path)
+        except OSError:
+            self._pending_step = None
             self.placeholder.setText("STEP file not found")
             self.placeholder.show()
             if self.plotter:
                 self.plotter.hide()
             return
         
+        # Revisiting a file: reuse its tessellation instead of running gmsh again
+        cache_key = (step_path, st.st_mtime_ns, st.st_size)
+        self._pending_step = cache_key
+        cached = self._step_cache.get(cache_key)
+        if cached:
+            self._step_cache.move_to_end(cache_key)
+            self._show_step_mesh(*cached)
+            return
+        
+        if not _ensure_pyvista():
+            self.placeholder.setText("pyvistaqt not installed")
+            return
+        
         # Show loading message
         self.placeholder.setText("Loading geometry...")
         self.placeholder.show()
         if self.plotter:
             self.plotter.hide()
         
-        # Convert STEP to temp mesh
-        temp_path = _step_to_temp_mesh(step_path)
-        if not temp_path:
-            self.placeholder.setText("Failed to load STEP geometry")
+        if cache_key not in self._step_tasks:
+            try:
+                import gmsh  # noqa: F401  (older gmsh sets signal handlers at import: do it on this thread)
+            except Exception:
+                pass
+            task = StepMeshTask(step_path, cache_key)
+            task.signals.finished.connect(self._on_step_mesh_ready)
+            self._step_tasks[cache_key] = task
+            self._step_pool.start(task)
+
+    @Slot(object, object, str)
+    def _on_step_mesh_ready(self, cache_key, meshes, error_msg):
+        self._step_tasks.pop(cache_key, None)
+        if meshes is not None:
+            self._step_cache[cache_key] = meshes
+            while len(self._step_cache) > self.STEP_CACHE_SIZE:
+                self._step_cache.popitem(last=False)
+        if cache_key != self._pending_step:
+            return  # another file was selected meanwhile
+        if meshes is None:
+            self.placeholder.setText(error_msg)
+            self.placeholder.show()
             return
-        
-        self._temp_file = temp_path
-        
+        self._show_step_mesh(*meshes)
+
+    def _show_step_mesh(self, mesh, edges):
+        """Display a tessellated STEP surface with its feature edges."""
         self._init_plotter()
         if not self.plotter:
             return
@@ -139,22 +311,13 @@ class MeshPreview(QWidget):
         self.plotter.show()
 
         try:
-            mesh = pv.read(temp_path)
             self.plotter.clear()
             
             # Show surface without mesh lines
             self.plotter.add_mesh(mesh, show_edges=False, color="#5C7C99", opacity=1.0)
-            
-            # Extract and show only feature edges (outer boundary and sharp edges)
-            edges = mesh.extract_feature_edges(
-                boundary_edges=True, 
-                feature_edges=True, 
-                manifold_edges=False,
-                non_manifold_edges=False,
-                feature_angle=30
-            )
-            self.plotter.add_mesh(edges, color="#2EE7FF", line_width=2, 
-                                  render_points_as_spheres=False, point_size=0)
+            if edges is not None:
+                self.plotter.add_mesh(edges, color="#2EE7FF", line_width=2, 
+                                      render_points_as_spheres=False, point_size=0)
             
             self.plotter.add_text("STEP Geometry", position='upper_left', font_size=10, color='white')
             self.plotter.reset_camera()
@@ -163,19 +326,7 @@ class MeshPreview(QWidget):
             self.placeholder.setText(f"Preview error: {str(e)}")
             self.placeholder.show()
 
-    def _cleanup_temp(self):
-        if self._temp_file and os.path.exists(self._temp_file):
-            try:
-                os.remove(self._temp_file)
-            except:
-                pass
-            self._temp_file = None
-
     def clear(self):
-        self._cleanup_temp()
+        self._pending_step = None
         if self.plotter:
             self.plotter.clear()
-
-    def closeEvent(self, event):
-        self._cleanup_temp()
-        super().closeEvent(event)
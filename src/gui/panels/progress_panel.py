@@ -3,6 +3,8 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QTextCursor
 
 class ProgressPanel(QWidget):
+    LOG_MAX_BLOCKS = 5000  # oldest lines are dropped beyond this; the full log stays in temp/
+
     def __init__(self):
         super().__init__()
         self._setup_ui()
@@ -25,6 +27,7 @@ class ProgressPanel(QWidget):
         layout.addWidget(QLabel("Logs:"))
         self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
+        self.log_area.setMaximumBlockCount(self.LOG_MAX_BLOCKS)
         # Style moved to QSS
         layout.addWidget(self.log_area)
 
@@ -37,6 +40,11 @@ class ProgressPanel(QWidget):
         self.log_area.appendPlainText(text)
         self.log_area.moveCursor(QTextCursor.MoveOperation.End)
 
+    def set_log(self, lines):
+        """Replace the log with the given lines (only the last LOG_MAX_BLOCKS are kept)."""
+        self.log_area.setPlainText("\n".join(lines[-self.LOG_MAX_BLOCKS:]))
+        self.log_area.moveCursor(QTextCursor.MoveOperation.End)
+
     def clear(self):
         self.log_area.clear()
         self.progress_bar.setValue(0)
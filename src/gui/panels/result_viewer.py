@@ -1,10 +1,12 @@
 import os
 import yaml
+from collections import OrderedDict
+from itertools import chain
 import pyvista as pv
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                                QLabel, QSlider, QComboBox, QFrame, QTabWidget,
                                QSizePolicy)
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, Slot, QTimer
 from pyvistaqt import QtInteractor
 import numpy as np
 import pandas as pd
@@ -16,22 +18,92 @@ from matplotlib.figure import Figure
 from src.utils.xplt_loader import WaffleironLoader
 
 
-class XpltLoaderThread(QThread):
-    """Background thread for loading .xplt files."""
-    finished = Signal(object, str)  # loader, error_message
-    progress = Signal(str)
+class _XpltLoadSignals(QObject):
+    finished = Signal(int, object, object, str)  # load_id, cache_key, (loader, grid, steps) or None, error_message
 
-    def __init__(self, xplt_path):
+
+class XpltLoadTask(QRunnable):
+    """Reads and parses a .xplt file (mesh and time steps) on a pool thread."""
+
+    def __init__(self, load_id, xplt_path, cache_key):
         super().__init__()
+        self.load_id = load_id
         self.xplt_path = xplt_path
+        self.cache_key = cache_key
+        self.signals = _XpltLoadSignals()
 
     def run(self):
         try:
-            self.progress.emit("Reading file...")
             loader = WaffleironLoader(self.xplt_path)
-            self.finished.emit(loader, "")
         except Exception as e:
-            self.finished.emit(None, str(e))
+            self.signals.finished.emit(self.load_id, self.cache_key, None, f"Error: {e}")
+            return
+        try:
+            grid = loader.get_mesh()
+            steps = loader.get_time_steps()
+        except Exception as e:
+            self.signals.finished.emit(self.load_id, self.cache_key, None, f"Parse Error: {e}")
+            return
+        self.signals.finished.emit(self.load_id, self.cache_key, (loader, grid, steps), "")
+
+
+def _frame_arrays(base_points, structure, point_arrays, cell_arrays, field):
+    """
+    (field or None, deformed points, node values) of one step, from its decoded arrays.
+    structure is a mesh with the result's cells (used to average cell data to the nodes);
+    nothing is written into it, so this also runs on the prefetch pool.
+    """
+    scalar = field if field and (field in point_arrays or field in cell_arrays) else None
+
+    # Warp by displacement if available: one float32 add over the node array (what
+    # warp_by_vector with factor 1 computes, without building a new grid); float32 is
+    # what VTK renders and halves the cached size
+    points = base_points
+    if "displacement" in point_arrays:
+        with np.errstate(all='ignore'):
+            points = np.add(base_points, point_arrays["displacement"], dtype=np.float32)
+
+    values = None
+    if scalar in point_arrays:
+        values = np.asarray(point_arrays[scalar])
+    elif scalar:
+        # Convert Cell Data to Point Data for smooth gradient display
+        # (Stress/Strain are computed at element level, need averaging at nodes)
+        probe = pv.UnstructuredGrid()
+        probe.copy_structure(structure)
+        probe.cell_data[scalar] = cell_arrays[scalar]
+        values = np.asarray(probe.cell_data_to_point_data().point_data[scalar])
+    # Vector/tensor fields are colored by magnitude
+    if values is not None and values.ndim > 1:
+        values = np.linalg.norm(values, axis=1)
+    return scalar, points, values
+
+
+class _StepPrefetchSignals(QObject):
+    finished = Signal(object, object, str)  # (load_id, step_idx, field), frame or None, error_message
+
+
+class StepPrefetchTask(QRunnable):
+    """Decodes one time step into display arrays on a pool thread (the shown grid is not touched)."""
+
+    def __init__(self, load_id, loader, structure, base_points, step_idx, field):
+        super().__init__()
+        self.key = (load_id, step_idx, field)
+        self.loader = loader
+        self.structure = structure
+        self.base_points = base_points
+        self.signals = _StepPrefetchSignals()
+
+    def run(self):
+        _, step_idx, field = self.key
+        try:
+            point_arrays, cell_arrays = self.loader.step_arrays(
+                step_idx, self.structure.n_cells, fields={field, "displacement"})
+            frame = _frame_arrays(self.base_points, self.structure, point_arrays, cell_arrays, field)
+        except Exception as e:
+            self.signals.finished.emit(self.key, None, str(e))
+            return
+        self.signals.finished.emit(self.key, frame, "")
 
 
 class ResultViewer(QWidget):
@@ -40,6 +112,12 @@ class ResultViewer(QWidget):
     - Tab 1: 3D Contour (PyVista)
     - Tab 2: Graph (PNG image)
     """
+    RESULT_CACHE_SIZE = 4  # parsed results kept for quick revisits
+    FRAME_CACHE_SIZE = 64  # (step, field) display arrays kept for scrubbing back and forth
+    PREFETCH_STEPS = 4     # steps after the shown one decoded while the viewer is idle
+    PREFETCH_BACK_STEPS = 2  # ... and before it, for scrubbing backwards
+    PREFETCH_THREADS = 1     # pool threads decoding prefetched steps (the GUI thread keeps one core)
+    DISPLAY_ARRAY = "values"  # name of the colored array on the display mesh, whatever the field
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -47,10 +125,35 @@ class ResultViewer(QWidget):
         self.grid = None
         self.steps = []
         self.current_step_idx = 0
-        self.load_thread = None
+        self._load_id = 0  # bumped by every load_result; results of older loads are not shown
+        self._load_tasks = {}  # load_id -> XpltLoadTask queued or running
         self.current_job_name = None
         self.result_dir = None
         self.temp_dir = None
+        # (xplt_path, mtime_ns, size) -> (loader, grid, steps), least recently shown first
+        self._result_cache = OrderedDict()
+        # Mesh/actor on screen; slider moves update their arrays instead of rebuilding the scene
+        self._display_mesh = None
+        self._actor = None
+        self._shown_scalar = None
+        self._base_points = None  # undeformed nodes of the shown result, contiguous float32
+        self._structure = None  # cells of the shown result without data, read by the prefetch tasks
+        # (step_idx, field) -> (field or None, deformed points, node values) of the shown result
+        self._frame_cache = OrderedDict()
+        # Neighbouring steps are decoded on a dedicated pool once the slider rests for a moment
+        self._prefetch_queue = []
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(self.PREFETCH_THREADS)
+        self._prefetch_tasks = {}  # (load_id, step_idx, field) -> StepPrefetchTask queued or running
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(50)
+        self._prefetch_timer.timeout.connect(self._start_prefetch)
+        # Slider drags fire valueChanged per tick: redraw at most once per frame, with the latest step
+        self._step_timer = QTimer(self)
+        self._step_timer.setSingleShot(True)
+        self._step_timer.setInterval(16)
+        self._step_timer.timeout.connect(self._update_display)
         
         # Load theme
         self.theme = self._load_theme()
@@ -212,16 +315,22 @@ class ResultViewer(QWidget):
             self.loading_overlay.setGeometry(x, y, overlay_width, overlay_height)
             self.loading_overlay.raise_()
 
-    def load_result(self, job_name, result_dir, temp_dir):
-        """Load result for a job."""
+    def load_result(self, job_name, result_dir, temp_dir, xplt_path=None):
+        """Load result for a job. xplt_path, when the caller already located the file, skips the search."""
         self.current_job_name = job_name
         self.result_dir = result_dir
         self.temp_dir = temp_dir
         self.job_label.setText(job_name)
+        self._load_id += 1
         
         # Clear previous
         self.plotter.clear()
         self._apply_plotter_theme()
+        self._display_mesh = None
+        self._actor = None
+        self._prefetch_queue = []
+        self._cancel_prefetch()
+        self._step_timer.stop()
         self.loader = None
         self.grid = None
         self.steps = []
@@ -234,32 +343,44 @@ class ResultViewer(QWidget):
         self._update_graph(job_name)
         
         # Find xplt file
-        base = job_name
-        paths_to_check = [
-            os.path.join(result_dir, f"{base}.xplt"),
-            os.path.join(temp_dir, f"{base}.xplt"),
-            os.path.join(os.getcwd(), "results", f"{base}.xplt"),
-            os.path.join(os.getcwd(), "temp", f"{base}.xplt"),
-        ]
-        
-        xplt_path = None
-        for p in paths_to_check:
-            if p and os.path.exists(p):
-                xplt_path = p
-                break
+        if xplt_path is None:
+            base = job_name
+            paths_to_check = [
+                os.path.join(result_dir, f"{base}.xplt"),
+                os.path.join(temp_dir, f"{base}.xplt"),
+                os.path.join(os.getcwd(), "results", f"{base}.xplt"),
+                os.path.join(os.getcwd(), "temp", f"{base}.xplt"),
+            ]
+            for p in paths_to_check:
+                if p and os.path.exists(p):
+                    xplt_path = p
+                    break
         
         if not xplt_path:
+            self._hide_loading_overlay()
             self.plotter.add_text("No .xplt file found", position='upper_left', color='white')
             return
 
-        # Start loading thread
+        # Revisiting a recently shown result: reuse the parsed file and grid
+        try:
+            st = os.stat(xplt_path)
+            cache_key = (xplt_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+        cached = self._result_cache.get(cache_key)
+        if cached:
+            self._hide_loading_overlay()
+            self._result_cache.move_to_end(cache_key)
+            self._show_result(*cached)
+            return
+
+        # Parse in the background; a load still running for another job simply finishes unseen
         self._show_loading_overlay("Loading Result...")
         
-        self._stop_loading_thread()
-
-        self.load_thread = XpltLoaderThread(xplt_path)
-        self.load_thread.finished.connect(self._on_load_finished)
-        self.load_thread.start()
+        task = XpltLoadTask(self._load_id, xplt_path, cache_key)
+        task.signals.finished.connect(self._on_load_finished)
+        self._load_tasks[self._load_id] = task
+        QThreadPool.globalInstance().start(task)
     
     def _show_loading_overlay(self, text):
         """Show loading overlay with specified text."""
@@ -333,28 +454,34 @@ class ResultViewer(QWidget):
         ax.axis('off')
         self.graph_canvas.draw()
 
-    def _stop_loading_thread(self):
-        if self.load_thread and self.load_thread.isRunning():
-            self.load_thread.terminate()
-            self.load_thread.wait()
-            return True
-        return False
-
-    def _on_load_finished(self, loader, error_msg):
+    @Slot(int, object, object, str)
+    def _on_load_finished(self, load_id, cache_key, result, error_msg):
+        self._load_tasks.pop(load_id, None)
+        # Parsed results are cached even when another job was selected meanwhile
+        if result is not None and cache_key is not None:
+            self._result_cache[cache_key] = result
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        if load_id != self._load_id:
+            return
+        
         self._hide_loading_overlay()
         if error_msg:
-            self.plotter.add_text(f"Error: {error_msg}", position='upper_left', color='red')
-            return
-            
-        if not loader:
+            self.plotter.add_text(error_msg, position='upper_left', color='red')
             return
+        self._show_result(*result)
 
+    def _show_result(self, loader, grid, steps):
+        """Display a parsed result at its last time step."""
         self.loader = loader
+        self.grid = grid
+        self.steps = steps
+        self._frame_cache.clear()
+        self._base_points = np.ascontiguousarray(grid.points, dtype=np.float32)
+        self._structure = pv.UnstructuredGrid()
+        self._structure.copy_structure(grid)
         
         try:
-            self.grid = self.loader.get_mesh()
-            self.steps = self.loader.get_time_steps()
-            
             # Setup slider
             if self.steps:
                 self.time_slider.blockSignals(True)
@@ -371,6 +498,11 @@ class ResultViewer(QWidget):
             # Now populate fields (will see the loaded data)
             self._update_fields()
 
+            # The grid already holds the last step: cache its frame so the first display does not decode it again
+            field = self.field_combo.currentText()
+            self._frame_cache[(self.current_step_idx, field)] = _frame_arrays(
+                self._base_points, self._structure, self.grid.point_data, self.grid.cell_data, field)
+
             # Initial display
             self._update_display(reset_cam=True)
             
@@ -385,27 +517,16 @@ class ResultViewer(QWidget):
         self.field_combo.blockSignals(True)
         self.field_combo.clear()
         
-        fields = []
+        # Point data fields, then cell data fields not already listed
+        fields = dict.fromkeys(chain(self.grid.point_data.keys(), self.grid.cell_data.keys()))
         
-        # Point data fields
-        for k in self.grid.point_data.keys():
-            fields.append(k)
-            
-        # Cell data fields (prefixed to distinguish)
-        for k in self.grid.cell_data.keys():
-            if k not in fields:
-                fields.append(k)
-        
-        # Sort fields with priority order
-        priority_order = ["displacement", "Lagrange strain", "stress", "velocity"]
-        sorted_fields = []
-        for pf in priority_order:
-            for f in fields:
-                if pf.lower() in f.lower() and f not in sorted_fields:
-                    sorted_fields.append(f)
-        for f in fields:
-            if f not in sorted_fields:
-                sorted_fields.append(f)
+        # Sort fields with priority order: by the first priority name they contain,
+        # the rest after them (stable, so file order is kept within each group)
+        priority_order = ["displacement", "lagrange strain", "stress", "velocity"]
+        def rank(f):
+            f = f.lower()
+            return next((i for i, pf in enumerate(priority_order) if pf in f), len(priority_order))
+        sorted_fields = sorted(fields, key=rank)
         
         self.field_combo.addItems(sorted_fields)
         
@@ -417,7 +538,8 @@ class ResultViewer(QWidget):
 
     def on_slider_move(self, val):
         self.current_step_idx = val
-        self._update_display(reset_cam=False)
+        if not self._step_timer.isActive():
+            self._step_timer.start()
 
     def on_field_changed(self, text):
         if not self.grid:
@@ -429,21 +551,42 @@ class ResultViewer(QWidget):
         if not self.loader or not self.grid:
             return
         
+        # Update labels
+        if self.steps:
+            t = self.steps[self.current_step_idx]
+            self.time_label.setText(f"Time: {t:.4f}")
+            self.step_label.setText(f"Step: {self.current_step_idx + 1}/{len(self.steps)}")
+        
+        # Cached frames are a dict lookup; only a miss decodes the step (and can fail)
         try:
-            # Load step data
-            self.loader.load_step_result(self.grid, self.current_step_idx)
-            
-            # Update labels
-            if self.steps:
-                t = self.steps[self.current_step_idx]
-                self.time_label.setText(f"Time: {t:.4f}")
-                self.step_label.setText(f"Step: {self.current_step_idx + 1}/{len(self.steps)}")
+            scalar, points, values = self._frame(self.current_step_idx, self.field_combo.currentText())
+        except Exception as e:
+            print(f"Step Load Error: {e}")
+            return
+        
+        try:
+            if self._actor is not None and (scalar is None) == (self._shown_scalar is None) and not reset_cam:
+                # Another step or field: swap the arrays of the mesh on screen and retitle the
+                # scalar bar (no scene rebuild)
+                self._display_mesh.points = points
+                if values is not None:
+                    self._display_mesh.point_data[self.DISPLAY_ARRAY] = values
+                    self._display_mesh.set_active_scalars(self.DISPLAY_ARRAY)
+                    value_range = self._value_range(values)
+                    if value_range:
+                        self._actor.mapper.scalar_range = value_range
+                    if scalar != self._shown_scalar:
+                        self.plotter.scalar_bar.SetTitle(scalar)
+                        self._shown_scalar = scalar
+                self.plotter.render()
+                self._schedule_prefetch()
+                return
             
-            # Warp by displacement if available
-            display_mesh = self.grid
-            if "displacement" in self.grid.point_data:
-                with np.errstate(all='ignore'):
-                    display_mesh = self.grid.warp_by_vector("displacement", factor=1.0)
+            display_mesh = pv.UnstructuredGrid()
+            display_mesh.copy_structure(self.grid)
+            display_mesh.SetPoints(pv.vtk_points(points))  # own points object: the grid keeps its undeformed nodes
+            if values is not None:
+                display_mesh.point_data[self.DISPLAY_ARRAY] = values
             
             # Save camera
             cam = self.plotter.camera_position if not reset_cam else None
@@ -451,11 +594,6 @@ class ResultViewer(QWidget):
             self.plotter.clear()
             self._apply_plotter_theme()
             
-            # Get current field
-            scalar = self.field_combo.currentText()
-            if not scalar:
-                scalar = None
-            
             # Get theme settings (flat dict now)
             cmap = self.theme.get("colormap", "turbo")
             legend_color = self.theme.get("legend_text_color", "#cccccc")
@@ -469,45 +607,123 @@ class ResultViewer(QWidget):
                 "title_font_size": title_size,
                 "label_font_size": label_size,
                 "color": legend_color,
-                "font_family": "arial"
+                "font_family": "arial",
+                "render": False
             }
             
-            # Add mesh
-            if scalar and (scalar in display_mesh.point_data or scalar in display_mesh.cell_data):
-                # Convert Cell Data to Point Data for smooth gradient display
-                # (Stress/Strain are computed at element level, need averaging at nodes)
-                if scalar in display_mesh.cell_data and scalar not in display_mesh.point_data:
-                    display_mesh = display_mesh.cell_data_to_point_data()
-                
-                self.plotter.add_mesh(
+            # Add mesh (render=False throughout: one render once the scene is complete)
+            if scalar:
+                actor = self.plotter.add_mesh(
                     display_mesh, 
-                    scalars=scalar, 
+                    scalars=self.DISPLAY_ARRAY, 
+                    clim=self._value_range(values),
                     cmap=cmap, 
                     show_edges=True,
                     edge_color=edge_color,
                     line_width=0.5,
-                    scalar_bar_args=sbar_args
+                    scalar_bar_args=sbar_args,
+                    render=False
                 )
             else:
-                self.plotter.add_mesh(
+                actor = self.plotter.add_mesh(
                     display_mesh, 
                     color="lightblue", 
                     show_edges=True,
-                    edge_color=edge_color
+                    edge_color=edge_color,
+                    render=False
                 )
-                self.plotter.add_text("No scalar data for selected field", position='upper_left', color='white')
+                self.plotter.add_text("No scalar data for selected field", position='upper_left', color='white',
+                                      render=False)
+            self._display_mesh = display_mesh
+            self._actor = actor
+            self._shown_scalar = scalar
             
             if cam:
                 self.plotter.camera_position = cam
             else:
-                self.plotter.reset_camera()
+                self.plotter.renderer.reset_camera(render=False)
+            self.plotter.render()
+            self._schedule_prefetch()
                 
         except Exception as e:
             print(f"Display Error: {e}")
 
+    def _frame(self, step_idx, field):
+        """Field name (None if absent), deformed points and node values of one step, cached."""
+        key = (step_idx, field)
+        frame = self._frame_cache.get(key)
+        if frame is not None:
+            self._frame_cache.move_to_end(key)
+            return frame
+        
+        # Load step data (only the arrays this frame needs; all fields were loaded once in _show_result)
+        self.loader.load_step_result(self.grid, step_idx, fields={field, "displacement"})
+        frame = _frame_arrays(self._base_points, self._structure, self.grid.point_data, self.grid.cell_data, field)
+        self._frame_cache[key] = frame
+        while len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+            self._frame_cache.popitem(last=False)
+        return frame
+
+    def _schedule_prefetch(self):
+        """Queue the neighbouring steps for decoding once the slider has been still for a moment."""
+        idx = self.current_step_idx
+        # Nearest first, alternating forward/backward: +1, -1, +2, -2, +3, +4
+        deltas = []
+        for d in range(1, self.PREFETCH_STEPS + 1):
+            deltas.append(d)
+            if d <= self.PREFETCH_BACK_STEPS:
+                deltas.append(-d)
+        self._prefetch_queue = [idx + d for d in deltas if 0 <= idx + d < len(self.steps)]
+        self._prefetch_timer.start()  # restarts while the slider keeps moving
+
+    def _start_prefetch(self):
+        """Hand the queued steps that are neither cached nor already decoding to the prefetch pool."""
+        if not self.loader or not self.grid:
+            return
+        field = self.field_combo.currentText()
+        wanted = [(self._load_id, idx, field) for idx in self._prefetch_queue]
+        self._prefetch_queue = []
+        self._cancel_prefetch(keep=wanted)
+        for key in wanted:
+            if key[1:] in self._frame_cache or key in self._prefetch_tasks:
+                continue
+            task = StepPrefetchTask(self._load_id, self.loader, self._structure, self._base_points, *key[1:])
+            task.signals.finished.connect(self._on_prefetch_finished)
+            self._prefetch_tasks[key] = task
+            self._prefetch_pool.start(task)
+
+    def _cancel_prefetch(self, keep=()):
+        """Take back the prefetch tasks that have not started (running ones finish unseen)."""
+        for key, task in list(self._prefetch_tasks.items()):
+            if key not in keep and self._prefetch_pool.tryTake(task):
+                del self._prefetch_tasks[key]
+
+    @Slot(object, object, str)
+    def _on_prefetch_finished(self, key, frame, error_msg):
+        self._prefetch_tasks.pop(key, None)
+        load_id, step_idx, field = key
+        if load_id != self._load_id:
+            return  # decoded for a result that is no longer shown
+        if error_msg:
+            print(f"Prefetch Error: {error_msg}")
+            return
+        if (step_idx, field) not in self._frame_cache:
+            self._frame_cache[(step_idx, field)] = frame
+            while len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+
+    @staticmethod
+    def _value_range(values):
+        with np.errstate(all='ignore'):
+            lo, hi = float(np.nanmin(values)), float(np.nanmax(values))
+        if not (np.isfinite(lo) and np.isfinite(hi)):
+            return None  # no data (e.g. all NaN): let the mapper keep its default range
+        return (lo, hi)
+
     def cleanup(self):
         """Cleanup resources."""
-        self._stop_loading_thread()
+        self._load_id += 1  # drop any load still in flight
+        self._cancel_prefetch()
         try:
             self.plotter.close()
         except:
@@ -3,15 +3,30 @@ Icon and UI utilities for VEXIS-CAE GUI.
 """
 
 import os
+import re
 import sys
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QIcon, QImageReader, QPixmap
 from PySide6.QtWidgets import QStyle
 
 # Icon cache for performance
 _icon_cache = {}
+# Scaled image cache: (path, width, height) -> QPixmap
+_pixmap_cache = {}
 
+# Icon directory, and the file names in it (listed once, on the first icon load)
+if getattr(sys, "frozen", False):
+    _ICON_DIR = os.path.join(os.path.dirname(sys.executable), "src", "icons")
+else:
+    # Dev: src/gui/utils.py -> src/gui -> src -> src/icons
+    _ICON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons")
+_icon_files = None
 
-def load_icon(name: str, fallback_standard, style: QStyle = None) -> QIcon:
+# Black fills/strokes to recolor: "#000000" or "black", in single or double quotes
+_BLACK_RE = re.compile(r"""(['"])(?:#000000|black)\1""")
+
+
+def load_icon(name: str, fallback_standard, style: QStyle = None, need_disabled: bool = False) -> QIcon:
     """
     Load an icon by name with SVG color replacement and caching.
     
@@ -19,45 +34,48 @@ def load_icon(name: str, fallback_standard, style: QStyle = None) -> QIcon:
         name: Icon name without extension (e.g., 'start', 'pause')
         fallback_standard: Qt standard icon to use if custom icon not found (e.g., QStyle.SP_MediaPlay)
         style: QStyle instance for fallback (optional, uses app style if None)
+        need_disabled: Also render the dark disabled-state pixmap; only for actions
+            that are disabled at runtime (others never show it)
     
     Returns:
         QIcon: The loaded or cached icon
     """
-    cache_key = name
+    global _icon_files
+    cache_key = (name, need_disabled)
     if cache_key in _icon_cache:
         return _icon_cache[cache_key]
     
-    # Determine icon directory
-    if getattr(sys, "frozen", False):
-        icon_dir = os.path.join(os.path.dirname(sys.executable), "src", "icons")
-    else:
-        # Dev: src/gui/utils.py -> src/gui -> src -> src/icons
-        icon_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons")
+    # One directory listing instead of an existence check per icon and format
+    if _icon_files is None:
+        try:
+            _icon_files = {os.path.normcase(f) for f in os.listdir(_ICON_DIR)}
+        except OSError:
+            _icon_files = set()
     
     # Priority 1: SVG with dynamic recoloring
-    svg_path = os.path.join(icon_dir, f"{name}.svg")
-    if os.path.exists(svg_path):
+    svg_path = os.path.join(_ICON_DIR, f"{name}.svg")
+    if os.path.normcase(f"{name}.svg") in _icon_files:
         try:
             with open(svg_path, "r", encoding="utf-8") as f:
                 svg_content = f.read()
             
             # Normal State: Theme White
             normal_pixmap = _create_colored_pixmap(svg_content, "#EAF2FF")
-            # Disabled State: Darker Gray
-            disabled_pixmap = _create_colored_pixmap(svg_content, "#353D4A")
             
             if not normal_pixmap.isNull():
                 icon = QIcon()
                 icon.addPixmap(normal_pixmap, QIcon.Normal)
-                icon.addPixmap(disabled_pixmap, QIcon.Disabled)
+                if need_disabled:
+                    # Disabled State: Darker Gray
+                    icon.addPixmap(_create_colored_pixmap(svg_content, "#353D4A"), QIcon.Disabled)
                 _icon_cache[cache_key] = icon
                 return icon
         except Exception as e:
             print(f"SVG load error for {name}: {e}")
     
     # Priority 2: ICO (Legacy)
-    ico_path = os.path.join(icon_dir, f"{name}.ico")
-    if os.path.exists(ico_path):
+    ico_path = os.path.join(_ICON_DIR, f"{name}.ico")
+    if os.path.normcase(f"{name}.ico") in _icon_files:
         icon = QIcon(ico_path)
         _icon_cache[cache_key] = icon
         return icon
@@ -75,6 +93,48 @@ def load_icon(name: str, fallback_standard, style: QStyle = None) -> QIcon:
     return QIcon()
 
 
+def load_scaled_pixmap(path: str, width: int, height: int = None) -> QPixmap:
+    """
+    Load an image scaled to fit width x height (aspect ratio kept), with caching.
+    
+    The image reader is asked for the target size, so formats that can decode
+    scaled (e.g. JPEG) never materialize the full-size image, and no full-size
+    QPixmap is created for any format.
+    
+    Args:
+        path: Image file path
+        width, height: Bounding box of the scaled image (height None: scale to width)
+    
+    Returns:
+        QPixmap: The scaled pixmap, or a null QPixmap if the file does not exist
+    """
+    cache_key = (path, width, height)
+    if cache_key in _pixmap_cache:
+        return _pixmap_cache[cache_key]
+    
+    if not os.path.exists(path):
+        return QPixmap()
+    
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and not size.isEmpty():
+        if height is None:
+            target = QSize(width, max(1, round(size.height() * width / size.width())))
+        else:
+            target = size.scaled(width, height, Qt.KeepAspectRatio)
+        reader.setScaledSize(target)
+    image = reader.read()
+    if image.isNull():
+        return QPixmap()
+    if not size.isValid():  # the format could not report its size up front
+        image = (image.scaledToWidth(width, Qt.SmoothTransformation) if height is None
+                 else image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    pixmap = QPixmap.fromImage(image)
+    _pixmap_cache[cache_key] = pixmap
+    return pixmap
+
+
 def _create_colored_pixmap(svg_content: str, color: str) -> QPixmap:
     """
     Create a QPixmap from SVG content with color replacement.
@@ -86,11 +146,7 @@ def _create_colored_pixmap(svg_content: str, color: str) -> QPixmap:
     Returns:
         QPixmap: The rendered pixmap
     """
-    recolored = (svg_content
-                 .replace('"#000000"', f'"{color}"')
-                 .replace('"black"', f'"{color}"')
-                 .replace("'#000000'", f"'{color}'")
-                 .replace("'black'", f"'{color}'"))
+    recolored = _BLACK_RE.sub(lambda m: f"{m.group(1)}{color}{m.group(1)}", svg_content)
     data = bytearray(recolored, encoding='utf-8')
     pm = QPixmap()
     pm.loadFromData(data, "SVG")
@@ -98,6 +154,8 @@ def _create_colored_pixmap(svg_content: str, color: str) -> QPixmap:
 
 
 def clear_icon_cache():
-    """Clear the icon cache to free memory."""
-    global _icon_cache
+    """Clear the icon and pixmap caches to free memory."""
+    global _icon_cache, _icon_files
     _icon_cache.clear()
+    _pixmap_cache.clear()
+    _icon_files = None
@@ -85,13 +85,32 @@ class WaffleironLoader:
         """Return list of time values for each step."""
         return self.xplt_data.step_times
         
-    def load_step_result(self, grid: pv.UnstructuredGrid, step_idx: int):
+    def load_step_result(self, grid: pv.UnstructuredGrid, step_idx: int, fields=None):
         """
         Load results for specific step into the grid.
         Modifies grid in-place.
+        Only the variables named in fields are converted (all if None); others keep their previous values.
         """
+        point_arrays, cell_arrays = self.step_arrays(step_idx, grid.n_cells, fields)
+        for var_name, arr in point_arrays.items():
+            try:
+                grid.point_data[var_name] = arr
+            except Exception as e:
+                print(f"Failed to set point data {var_name}: {e}")
+        for var_name, arr in cell_arrays.items():
+            try:
+                grid.cell_data[var_name] = arr
+            except Exception as e:
+                print(f"Failed to set cell data {var_name}: {e}")
+
+    def step_arrays(self, step_idx: int, n_cells: int, fields=None):
+        """
+        Convert one step's results to numpy arrays without touching a grid (safe off the GUI thread).
+        Returns (point arrays, cell arrays), dicts of variable name -> array; cell arrays have n_cells rows.
+        """
+        point_arrays, cell_arrays = {}, {}
         if step_idx < 0 or step_idx >= len(self.xplt_data.step_blocks):
-            return
+            return point_arrays, cell_arrays
 
         # Get raw data dict
         # Keys are like ('displacement', 'node'), ('stress', 'domain')
@@ -99,32 +118,36 @@ class WaffleironLoader:
         
         for (var_name, region_type), values in step_data.items():
             if var_name == "time": continue
+            if fields is not None and var_name not in fields: continue
             
-            # Node data -> grid.point_data
+            # Node data -> point arrays
             if region_type == "node":
                 if not values: continue
                 
                 try:
-                    arr = np.array(values)
-                    grid.point_data[var_name] = arr
+                    # float32 is what VTK renders; half the bytes of numpy's default float64
+                    try:
+                        arr = np.array(values, dtype=np.float32)
+                    except (TypeError, ValueError):
+                        arr = np.array(values)
+                    point_arrays[var_name] = arr
                 except Exception as e:
-                    print(f"Failed to set point data {var_name}: {e}")
+                    print(f"Failed to convert point data {var_name}: {e}")
 
-            # Domain (Element) data -> grid.cell_data
+            # Domain (Element) data -> cell arrays
             elif region_type == "domain":
                 if not values: continue
                 
                 try:
                     # Convert to numpy
                     try:
-                        arr = np.array(values, dtype=float)
+                        arr = np.array(values, dtype=np.float32)
                     except Exception:
                         arr = np.array(values)
                         if arr.dtype == object:
-                            arr = np.vstack(values).astype(float)
+                            arr = np.vstack(values).astype(np.float32)
                     
                     data_len = len(arr)
-                    n_cells = grid.n_cells
                     
                     # Calculate offset: rigid body elements at the start don't have domain data
                     # Domain data length < grid cells means some elements are rigid/excluded
@@ -132,17 +155,15 @@ class WaffleironLoader:
                     
                     # Create output array with NaN for cells without data
                     if arr.ndim == 1:
-                        out_arr = np.full(n_cells, np.nan, dtype=float)
+                        out_arr = np.full(n_cells, np.nan, dtype=np.float32)
                         out_arr[offset:] = arr
                     else:
-                        out_arr = np.full((n_cells,) + arr.shape[1:], np.nan, dtype=float)
+                        out_arr = np.full((n_cells,) + arr.shape[1:], np.nan, dtype=np.float32)
                         out_arr[offset:] = arr
                     
-                    grid.cell_data[var_name] = out_arr
+                    cell_arrays[var_name] = out_arr
                         
                 except Exception as e:
-                    print(f"Failed to set cell data {var_name}: {e}")
+                    print(f"Failed to convert cell data {var_name}: {e}")
 
-        # Always ensure 'displacement' is present for warping
-        if "displacement" not in grid.point_data:
-            pass
+        return point_arrays, cell_arrays